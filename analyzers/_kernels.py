@@ -0,0 +1,206 @@
+"""
+@file _kernels.py
+@brief Numeric kernels shared by analyzers.
+       Each kernel has a Numba implementation (used when numba is installed)
+       and an equivalent NumPy fallback with identical results.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None
+
+
+HAVE_NUMBA: bool = numba is not None
+
+
+def _roi_payback_numpy(pct, cost, budget, profit, dur, out_roi, out_pay) -> None:
+    """
+    @brief NumPy fallback for compute_roi_payback().
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out_roi[:] = np.select(
+            [~np.isnan(pct), (cost > 0) & ~np.isnan(profit), (budget > 0) & ~np.isnan(profit)],
+            [pct / 100.0, profit / cost, profit / budget],
+            default=np.nan,
+        )
+        daily_profit = profit / np.where(dur == 0, np.nan, dur)
+        out_pay[:] = np.where((budget > 0) & (daily_profit > 0), budget / daily_profit, np.nan)
+
+
+if HAVE_NUMBA:
+    @numba.njit(cache=True)
+    def _roi_payback_numba(pct, cost, budget, profit, dur, out_roi, out_pay):
+        nan = np.nan
+        for i in range(pct.size):
+            p = pct[i]
+            c = cost[i]
+            b = budget[i]
+            pr = profit[i]
+
+            # ROI: roi_pct - profit/actual - profit/budget (first match wins)
+            if not np.isnan(p):
+                out_roi[i] = p / 100.0
+            elif c > 0 and not np.isnan(pr):
+                out_roi[i] = pr / c
+            elif b > 0 and not np.isnan(pr):
+                out_roi[i] = pr / b
+            else:
+                out_roi[i] = nan
+
+            # Payback: budget / (profit/day) when daily profit is positive
+            d = dur[i]
+            if d == 0 or np.isnan(d):
+                out_pay[i] = nan
+                continue
+            dp = pr / d
+            if b > 0 and dp > 0:
+                out_pay[i] = b / dp
+            else:
+                out_pay[i] = nan
+else:
+    _roi_payback_numba = None
+
+
+def compute_roi_payback(pct, cost, budget, profit, dur, out_roi, out_pay) -> None:
+    """
+    @brief Fill ROI ratio and payback days for each project in a single pass.
+    @param pct     explicit ROI, percent (float64, NaN if missing)
+    @param cost    actual cost (float64)
+    @param budget  budget (float64)
+    @param profit  profit (float64)
+    @param dur     duration in days (float64)
+    @param out_roi preallocated float64 output for ROI ratio
+    @param out_pay preallocated float64 output for payback days
+    """
+    if _roi_payback_numba is not None:
+        _roi_payback_numba(pct, cost, budget, profit, dur, out_roi, out_pay)
+    else:
+        _roi_payback_numpy(pct, cost, budget, profit, dur, out_roi, out_pay)
+
+
+def _partner_roi_numpy(codes, profit, cost, n_partners):
+    """
+    @brief NumPy fallback for partner_roi().
+    """
+    profit_sum = np.bincount(codes, weights=np.nan_to_num(profit, nan=0.0), minlength=n_partners)
+    cost_sum = np.bincount(codes, weights=np.nan_to_num(cost, nan=0.0), minlength=n_partners)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(cost_sum > 0, profit_sum / cost_sum, np.nan)
+
+
+if HAVE_NUMBA:
+    @numba.njit(cache=True)
+    def _partner_roi_numba(codes, profit, cost, n_partners):
+        profit_sum = np.zeros(n_partners)
+        cost_sum = np.zeros(n_partners)
+        for i in range(codes.size):
+            c = codes[i]
+            p = profit[i]
+            b = cost[i]
+            if not np.isnan(p):
+                profit_sum[c] += p
+            if not np.isnan(b):
+                cost_sum[c] += b
+
+        out = np.empty(n_partners)
+        for j in range(n_partners):
+            out[j] = profit_sum[j] / cost_sum[j] if cost_sum[j] > 0 else np.nan
+        return out
+else:
+    _partner_roi_numba = None
+
+
+def partner_roi(codes, profit, cost, n_partners) -> np.ndarray:
+    """
+    @brief Aggregate ROI per partner: sum(profit) / sum(cost) over the partner's rows.
+    @param codes      dense partner codes 0..n_partners-1 (e.g. from pd.factorize), int64
+    @param profit     profit per (project, partner) row, float64 (NaN counts as 0)
+    @param cost       cost base per row, float64 (NaN counts as 0)
+    @param n_partners number of partners
+    @return float64 array of length n_partners (NaN where the cost sum is not positive)
+    """
+    if _partner_roi_numba is not None:
+        return _partner_roi_numba(codes, profit, cost, n_partners)
+    return _partner_roi_numpy(codes, profit, cost, n_partners)
+
+
+def _dept_kpis_numpy(alloc, profit, dur, actual, budget, share, out_pay):
+    """
+    @brief NumPy fallback for dept_kpis().
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        has_roi = (alloc > 0) & ~np.isnan(profit)
+        roi = profit[has_roi] / alloc[has_roi]
+
+        daily_profit = profit / np.where(dur == 0, np.nan, dur)
+        out_pay[:] = np.where((alloc > 0) & (daily_profit > 0), alloc / daily_profit, np.nan)
+
+        actual_part = actual * share
+        plan_part = budget * share
+        has_util = ~np.isnan(actual_part) & (plan_part > 0)
+        util = actual_part[has_util] / plan_part[has_util] * 100.0
+
+    return (float(roi.sum()), int(roi.size), float(util.sum()), int(util.size),
+            float(np.nansum(alloc)), float(np.nansum(profit)))
+
+
+if HAVE_NUMBA:
+    @numba.njit(cache=True)
+    def _dept_kpis_numba(alloc, profit, dur, actual, budget, share, out_pay):
+        roi_sum = 0.0
+        roi_n = 0
+        util_sum = 0.0
+        util_n = 0
+        cost_sum = 0.0
+        profit_sum = 0.0
+        for i in range(alloc.size):
+            a = alloc[i]
+            pr = profit[i]
+            if not np.isnan(a):
+                cost_sum += a
+            if not np.isnan(pr):
+                profit_sum += pr
+
+            # ROI of the department's portion
+            if a > 0 and not np.isnan(pr):
+                roi_sum += pr / a
+                roi_n += 1
+
+            # Payback: allocation / (profit/day) when daily profit is positive
+            d = dur[i]
+            out_pay[i] = np.nan
+            if d != 0 and not np.isnan(d):
+                dp = pr / d
+                if a > 0 and dp > 0:
+                    out_pay[i] = a / dp
+
+            # Utilization: actual/plan of the department's portion, percent
+            act = actual[i] * share[i]
+            plan = budget[i] * share[i]
+            if not np.isnan(act) and plan > 0:
+                util_sum += act / plan * 100.0
+                util_n += 1
+        return roi_sum, roi_n, util_sum, util_n, cost_sum, profit_sum
+else:
+    _dept_kpis_numba = None
+
+
+def dept_kpis(alloc, profit, dur, actual, budget, share, out_pay) -> tuple:
+    """
+    @brief Department KPI aggregates over its projects in a single pass.
+    @param alloc   department allocation per project (float64)
+    @param profit  department's share of profit (float64)
+    @param dur     duration in days (float64)
+    @param actual  project actual cost (float64)
+    @param budget  project budget (float64)
+    @param share   department participation share (float64)
+    @param out_pay preallocated float64 output for payback days (NaN where undefined)
+    @return (roi_sum, roi_count, util_sum, util_count, cost_sum, profit_sum);
+            NaN allocations/profits count as 0 in cost_sum/profit_sum
+    """
+    if _dept_kpis_numba is not None:
+        return _dept_kpis_numba(alloc, profit, dur, actual, budget, share, out_pay)
+    return _dept_kpis_numpy(alloc, profit, dur, actual, budget, share, out_pay)
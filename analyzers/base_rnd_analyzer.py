@@ -4,20 +4,96 @@
        Loads JSON once, prepares DataFrames for employees and projects.
 """
 
-from typing import Any, Dict, List, Optional, Iterable
+from typing import Any, Dict, List, Optional, Iterable, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-import json
+import hashlib
+import io
 import math
+import os
+import pickle
+import threading
 from datetime import datetime
 import pandas as pd
 import numpy as np
+import matplotlib
+# Plots draw on Figure objects with an explicit Agg canvas (see new_axes), never through
+# pyplot, so no backend has to be selected with matplotlib.use()
+from matplotlib.figure import Figure, SubplotParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+try:  # optional streaming JSON parser
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configuration and types
 from config.enums import (
-    Degree, DEGREE_ORDER, DEGREE_MAP_RU,
+    Degree, DEGREE_MAP_RU, DEGREE_DTYPE,
     ProjectStatus, ProjectType, Thresholds
 )
+from utilits.io import load_json
 from utilits.logger import analysis_logger
+import config.enums
+import utilits.io
+
+
+# @brief Sources whose edits invalidate disk cache entries: this module (builders),
+#        config/enums.py (degree/status tables) and utilits/io.py (JSON parsing)
+DISK_CACHE_SOURCES: Tuple[str, ...] = (__file__, config.enums.__file__, utilits.io.__file__)
+
+
+# @brief Lowercase education label - canonical degree (RU labels + simple EN tokens)
+DEGREE_LOOKUP: Dict[str, str] = {
+    **DEGREE_MAP_RU,
+    "phd": Degree.PHD.value,
+    "msc": Degree.MASTER.value,
+    "master": Degree.MASTER.value,
+    "ms": Degree.MASTER.value,
+    "bachelor": Degree.BACHELOR.value,
+    "bs": Degree.BACHELOR.value,
+}
+DEGREE_NONE: str = Degree.NONE.value
+DEGREE_OTHER: str = Degree.OTHER.value
+
+
+# @brief Per-thread reusable plot figure (renderers run on several threads or worker processes)
+_FIG_LOCAL = threading.local()
+
+
+def new_axes(figsize=None):
+    """
+    @brief Clear the calling thread's reusable Agg figure and return (fig, ax).
+    @param figsize Figure size in inches (None - rcParams default)
+    @note The figure is created lazily per thread and is not registered with pyplot, so no
+          plt.close() is needed. Size and subplot parameters are reset on reuse, so
+          tight_layout() from a previous plot does not leak.
+    """
+    fig = getattr(_FIG_LOCAL, "fig", None)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        _FIG_LOCAL.fig = fig
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize if figsize is not None else matplotlib.rcParams["figure.figsize"])
+        fig.subplotpars = SubplotParams()
+    return fig, fig.add_subplot(111)
+
+
+def render_empty(path: str, title: str, dpi: int = 130) -> str:
+    """
+    @brief Draw and save an empty placeholder plot with a title, for charts with no data.
+    @param path  Output PNG path
+    @param title Plot title
+    @param dpi   Output resolution
+    @return str path to saved image
+    """
+    fig, ax = new_axes()
+    ax.set_title(title)
+    return BaseAnalyzer._save(fig, path, dpi=dpi)
 
 
 @dataclass
@@ -29,46 +105,228 @@ class LoadResult:
     projects: List[Dict[str, Any]]
     equipment: List[Dict[str, Any]]
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadResult":
+        """@brief Split a parsed company.json document into its sections (missing - empty)."""
+        return cls(
+            metadata    = data.get("metadata", {}) or {},
+            departments = data.get("departments", []) or [],
+            employees   = data.get("employees", []) or [],
+            projects    = data.get("projects", []) or [],
+            equipment   = data.get("equipment", []) or [],
+        )
+
+
+def load_company(path: str, department_id: int = 26) -> LoadResult:
+    """
+    @brief Load company.json once, e.g. to share it between analyzers via their data= argument.
+    @param path Path to company.json
+    @param department_id Department whose frames are prepared alongside
+    @return LoadResult (employees filtered by department_id when the file was streamed)
+    @throws FileNotFoundError, json.JSONDecodeError on read/parse issues
+    @note Goes through BaseAnalyzer's loader: in-memory and disk caches keyed on the file's
+          (path, mtime, size), ijson streaming for large files. Analyzers given this
+          LoadResult as data= reuse the frames prepared here.
+    """
+    return BaseAnalyzer(path, department_id).raw
+
 
 class BaseAnalyzer:
     """
     @brief Base class for all analyzers.
     @param json_path Path to company.json
     @param department_id Target department id (default 26 - R&D)
+    @param data Already parsed company data (LoadResult or dict); when given, json_path is not read
     @throws FileNotFoundError, json.JSONDecodeError on read/parse issues
     """
 
-    def __init__(self, json_path: str, department_id: 26) -> None:
+    # @brief Files of at least this size are streamed with ijson (if installed)
+    STREAM_MIN_BYTES: int = 64 * 1024 * 1024
+
+    # @brief Parsed data shared by all analyzer instances, LRU by (path, mtime, department_id);
+    #        data= entries are keyed by ("", id(LoadResult), department_id)
+    SHARED_CACHE_SIZE: int = 4
+    _shared: "OrderedDict[Tuple[str, int, int], Tuple[LoadResult, pd.DataFrame, pd.DataFrame]]" = OrderedDict()
+
+    # @brief Directory for the on-disk cache of prepared data (pickle), reused across runs.
+    #        Opt-in: disabled unless RND_ANALYZER_CACHE_DIR names a directory
+    DISK_CACHE_DIR: str = os.environ.get("RND_ANALYZER_CACHE_DIR", "")
+    # @brief Bump when the cached layout changes; edits to DISK_CACHE_SOURCES also invalidate entries
+    DISK_CACHE_VERSION: int = 3
+
+    def __init__(self, json_path: str, department_id: 26,
+                 data: Optional[Union[LoadResult, Dict[str, Any]]] = None) -> None:
         self.json_path = json_path
         self.department_id = department_id
         self.logger = analysis_logger.get_logger(self.__class__.__name__)
         self.logger.info("Initializing BaseAnalyzer")
+        # Background plot renderer, started on the first _submit_plot() call
+        self._plot_executor: Optional[ThreadPoolExecutor] = None
 
-        raw = self._load_json(json_path)
-        self.raw = raw
-
-        # Prepare DataFrames for subclasses
-        self.employees_df_ = self._build_employees_df(raw.employees, department_id)
-        self.projects_df_  = self._build_projects_df(raw.projects, department_id)
+        # References to the shared (cached) data, not copies - treat as read-only
+        if data is not None:
+            self.raw, self.employees_df_, self.projects_df_ = self._prepare_data(data, department_id)
+        else:
+            self.raw, self.employees_df_, self.projects_df_ = self._load_and_prepare(json_path, department_id)
 
         self.logger.info(
             f"DF ready: employees={len(self.employees_df_)} rows; projects={len(self.projects_df_)} rows"
         )
 
 
-    def employees_df(self) -> pd.DataFrame:
+    def employees_df(self, copy: bool = True) -> pd.DataFrame:
         """
         @brief Normalized employees DataFrame for department.
-        @return pd.DataFrame
+        @param copy Return a private copy; pass False only from read-only code
+        @return pd.DataFrame (with copy=False: the frame shared through _shared by all analyzers)
+        @note Read-only opt-outs: ScientificAnalyzer.execute_analysis() and _certs_pie_job().
         """
-        return self.employees_df_.copy()
+        return self.employees_df_.copy() if copy else self.employees_df_
 
-    def projects_df(self) -> pd.DataFrame:
+    def projects_df(self, copy: bool = True) -> pd.DataFrame:
         """
         @brief Normalized projects DataFrame with participation of department.
-        @return pd.DataFrame
+        @param copy Return a private copy; pass False only from read-only code
+        @return pd.DataFrame (with copy=False: the frame shared through _shared by all analyzers)
+        @note Read-only opt-outs: ProjectAnalyzer (execute_analysis() and plot jobs, which
+              only use assign()/nlargest()) and InterdepartmentalAnalyzer.execute_analysis().
+        """
+        return self.projects_df_.copy() if copy else self.projects_df_
+
+    def report_text(self, result: Dict[str, Any]) -> str:
+        """
+        @brief Formatted report section, memoized on the identity of the result dict.
+        @param result Output of execute_analysis()
+        @return str from print(); repeated calls with the same result reuse it
+        """
+        cached = getattr(self, "_report_text_cache", None)
+        if cached is not None and cached[0] is result:
+            return cached[1]
+        text = self.print(result)
+        self._report_text_cache = (result, text)
+        return text
+
+    def _load_and_prepare(self, path: str, dep_id: int) -> Tuple[LoadResult, pd.DataFrame, pd.DataFrame]:
         """
-        return self.projects_df_.copy()
+        @brief Load JSON and build DataFrames, or reuse them if the same file was already prepared.
+        @param path Path to company.json
+        @param dep_id Department filter
+        @return (LoadResult, employees DataFrame, projects DataFrame)
+        @note The file is re-read when its modification time changes.
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, dep_id)
+        shared = BaseAnalyzer._shared
+        if key in shared:
+            shared.move_to_end(key)
+            self.logger.info(f"Reusing parsed data for {path} (department_id={dep_id})")
+            return shared[key]
+
+        cache_path = self._disk_cache_path(key, stat.st_size)
+        entry = self._read_disk_cache(cache_path)
+        if entry is None:
+            raw = self._load_json(path)
+
+            # Prepare DataFrames for subclasses
+            entry = (
+                raw,
+                self._build_employees_df(raw.employees, dep_id),
+                self._build_projects_df(raw.projects, dep_id),
+            )
+            self._write_disk_cache(cache_path, entry)
+
+        shared[key] = entry
+        while len(shared) > self.SHARED_CACHE_SIZE:
+            shared.popitem(last=False)
+        return entry
+
+    def _prepare_data(self, data: Union[LoadResult, Dict[str, Any]],
+                      dep_id: int) -> Tuple[LoadResult, pd.DataFrame, pd.DataFrame]:
+        """
+        @brief Build DataFrames from already parsed data, or reuse them for the same LoadResult object.
+        @param data LoadResult (shared by identity) or parsed company.json dict
+        @param dep_id Department filter
+        @return (LoadResult, employees DataFrame, projects DataFrame)
+        @note A dict is wrapped in a new LoadResult on each call; pass a LoadResult to share frames.
+              Frames prepared for the same LoadResult object (e.g. by load_company) are reused,
+              whatever key they were cached under.
+        """
+        raw = data if isinstance(data, LoadResult) else LoadResult.from_dict(data)
+        shared = BaseAnalyzer._shared
+        for key, entry in shared.items():
+            if entry[0] is raw and key[2] == dep_id:
+                shared.move_to_end(key)
+                self.logger.info(f"Reusing prepared data (department_id={dep_id})")
+                return entry
+
+        key = ("", id(raw), dep_id)
+
+        entry = (
+            raw,
+            self._build_employees_df(raw.employees, dep_id),
+            self._build_projects_df(raw.projects, dep_id),
+        )
+        shared[key] = entry
+        while len(shared) > self.SHARED_CACHE_SIZE:
+            shared.popitem(last=False)
+        return entry
+
+    def _disk_cache_path(self, key: Tuple[str, int, int], size: int) -> Optional[str]:
+        """
+        @brief Cache file for (path, mtime, department_id); None when the disk cache is disabled.
+        @param key  (absolute path, st_mtime_ns, department_id)
+        @param size Source file size in bytes
+        @return "<source>_<state>.pkl" path; <source> identifies path+department, <state> the file version
+        """
+        if not self.DISK_CACHE_DIR:
+            return None
+        abspath, mtime_ns, dep_id = key
+        source = hashlib.blake2b(f"{abspath}:{dep_id}".encode("utf-8"), digest_size=8).hexdigest()
+        code = ":".join(str(os.stat(src).st_mtime_ns) for src in DISK_CACHE_SOURCES)
+        state = hashlib.blake2b(
+            f"{mtime_ns}:{size}:{self.DISK_CACHE_VERSION}:{code}".encode("utf-8"),
+            digest_size=8,
+        ).hexdigest()
+        return os.path.join(self.DISK_CACHE_DIR, f"{source}_{state}.pkl")
+
+    def _read_disk_cache(self, cache_path: Optional[str]):
+        """
+        @brief Load a prepared (LoadResult, employees, projects) entry written by _write_disk_cache.
+        @return entry tuple, or None on miss / unreadable file
+        """
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                entry = pickle.load(f)
+        except Exception as exc:
+            self.logger.warning(f"Ignoring unreadable disk cache {cache_path}: {exc}")
+            return None
+        self.logger.info(f"Loaded prepared data from disk cache {cache_path}")
+        return entry
+
+    def _write_disk_cache(self, cache_path: Optional[str], entry) -> None:
+        """
+        @brief Persist a prepared entry atomically and drop stale versions of the same source.
+        @note Failures are logged and never interrupt the analysis.
+        """
+        if cache_path is None:
+            return
+        cache_dir, name = os.path.split(cache_path)
+        source = name.split("_", 1)[0] + "_"
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+            for old in os.listdir(cache_dir):
+                if old != name and old.startswith(source) and old.endswith(".pkl"):
+                    os.remove(os.path.join(cache_dir, old))
+        except (OSError, pickle.PicklingError) as exc:
+            self.logger.warning(f"Disk cache not written to {cache_path}: {exc}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
 
     def _load_json(self, path: str) -> LoadResult:
         """
@@ -77,20 +335,44 @@ class BaseAnalyzer:
         @return LoadResult
         """
         self.logger.info("Starting JSON load")
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        metadata    = data.get("metadata", {}) or {}
-        departments = data.get("departments", []) or []
-        employees   = data.get("employees", []) or []
-        projects    = data.get("projects", []) or []
-        equipment   = data.get("equipment", []) or []
+        if ijson is not None and os.path.getsize(path) >= self.STREAM_MIN_BYTES:
+            raw = self._stream_json(path)
+        else:
+            raw = LoadResult.from_dict(load_json(path))
 
         self.logger.info(
-            f"JSON loaded: meta={bool(metadata)}, dep={len(departments)}, "
-            f"emp={len(employees)}, proj={len(projects)}, eq={len(equipment)}"
+            f"JSON loaded: meta={bool(raw.metadata)}, dep={len(raw.departments)}, "
+            f"emp={len(raw.employees)}, proj={len(raw.projects)}, eq={len(raw.equipment)}"
         )
 
+        return raw
+
+    def _stream_json(self, path: str) -> LoadResult:
+        """
+        @brief Stream company.json with ijson instead of building the full DOM.
+        @param path Path to company.json
+        @return LoadResult with employees already filtered by department_id
+        @note Projects are kept in full: InnovativeAnalyzer compares cohorts company-wide.
+        """
+        self.logger.info(f"Streaming JSON (ijson/{ijson.backend})")
+        dep_id = self.department_id
+        with open(path, "rb") as f:
+            def section(name: str, default):
+                f.seek(0)
+                return next(ijson.items(f, name, use_float=True), default) or default
+
+            metadata    = section("metadata", {})
+            departments = section("departments", [])
+            projects    = section("projects", [])
+            equipment   = section("equipment", [])
+
+            # employees: keep only records of the department while parsing
+            f.seek(0)
+            employees = [
+                e for e in ijson.items(f, "employees.item", use_float=True)
+                if (e.get("work_info") or {}).get("department_id") == dep_id
+            ]
+
         return LoadResult(metadata, departments, employees, projects, equipment)
 
     def _build_employees_df(self, employees: List[Dict[str, Any]], dep_id: int) -> pd.DataFrame:
@@ -100,12 +382,16 @@ class BaseAnalyzer:
         @param dep_id Department filter
         @return Normalized pd.DataFrame
         """
-        rows = []
-        for e in employees:
-            wi = e.get("work_info", {}) or {}
-            if wi.get("department_id") != dep_id:
-                continue
+        emp_ids, names, positions, schedules = [], [], [], []
+        salary, hire, exp, perf = [], [], [], []
+        skills_col, langs_col, team_lead, clearance = [], [], [], []
+        degree_raw_col, certs = [], []
+
+        # Department filter as a list comprehension; the loop below only sees matches
+        dep_emps = [e for e in employees if (e.get("work_info") or {}).get("department_id") == dep_id]
 
+        for e in dep_emps:
+            wi = e.get("work_info") or {}
             pi = e.get("personal_info", {}) or {}
             ai = e.get("additional_info", {}) or {}
 
@@ -115,7 +401,6 @@ class BaseAnalyzer:
             ).strip()
 
             degree_raw = ai.get("education")
-            degree = self._normalize_degree(degree_raw)
 
             skills = wi.get("skills") or []
             if not isinstance(skills, list):
@@ -125,34 +410,50 @@ class BaseAnalyzer:
             if not isinstance(langs, list):
                 langs = [langs]
 
-            salary = self._to_float(wi.get("salary"))
-            perf   = self._to_float(wi.get("performance_score"))
-            exp    = self._to_int(wi.get("experience_years"))
-            certs  = self._to_int(ai.get("certifications"))
-            hire   = self._to_datetime(wi.get("hire_date"))
-
-            rows.append({
-                "employee_id": e.get("employee_id"),
-                "full_name": full_name,
-                "position": wi.get("position"),
-                "salary": salary,
-                "hire_date": hire,
-                "experience_years": exp,
-                "performance_score": perf,
-                "skills": skills,
-                "is_team_lead": bool(wi.get("is_team_lead", False)),
-                "work_schedule": wi.get("work_schedule"),
-                "degree_raw": degree_raw,
-                "degree": degree,
-                "certifications": certs,
-                "language_skills": langs,
-                "security_clearance": bool(ai.get("security_clearance", False)),
-            })
-
-        df = pd.DataFrame(rows)
+            emp_ids.append(e.get("employee_id"))
+            names.append(full_name)
+            positions.append(wi.get("position"))
+            salary.append(wi.get("salary"))
+            hire.append(wi.get("hire_date"))
+            exp.append(wi.get("experience_years"))
+            perf.append(wi.get("performance_score"))
+            skills_col.append(skills)
+            team_lead.append(bool(wi.get("is_team_lead", False)))
+            schedules.append(wi.get("work_schedule"))
+            degree_raw_col.append(degree_raw)
+            certs.append(ai.get("certifications"))
+            langs_col.append(langs)
+            clearance.append(bool(ai.get("security_clearance", False)))
+
+        # Column-oriented build: one array per field, no per-row dicts;
+        # type coercion runs once per column in pandas kernels
+        perf_num = self._float_column(perf)
+        certs_col = self._nullable_int_column(self._int_column(certs), "Int16")
+        df = pd.DataFrame({
+            "employee_id": emp_ids,
+            "full_name": names,
+            "position": pd.Categorical(positions),
+            "salary": self._float_column(salary).astype("float32"),
+            "hire_date": self._datetime_column(hire),
+            "experience_years": self._downcast_column(self._int_column(exp), "int16"),
+            "performance_score": perf_num,
+            "skills": skills_col,
+            "is_team_lead": np.asarray(team_lead, dtype=bool),
+            "work_schedule": pd.Categorical(schedules),
+            "degree_raw": degree_raw_col,
+            "degree": pd.Categorical(self._degree_column(degree_raw_col), dtype=DEGREE_DTYPE),
+            "certifications": certs_col,
+            "language_skills": langs_col,
+            "security_clearance": np.asarray(clearance, dtype=bool),
+            # numeric views for metrics: certificates with missing - 0 (float32 is exact for counts),
+            # score kept float64 so values just above Thresholds.PERF_TOP do not round onto it
+            "_certs_num": certs_col.to_numpy(dtype=np.float32, na_value=0.0),
+            "_perf_num": perf_num,
+        }, copy=False)
         # sort by performance
         if not df.empty and "performance_score" in df.columns:
-            df = df.sort_values("performance_score", ascending=False).reset_index(drop=True)
+            df = df.sort_values("performance_score", ascending=False, kind="stable",
+                                na_position="last", ignore_index=True)
 
         self.logger.info(f"Employees DF built: {len(df)} rows for department_id={dep_id}")
         return df
@@ -164,7 +465,13 @@ class BaseAnalyzer:
         @param dep_id 
         @return Normalized pd.DataFrame
         """
-        rows = []
+        proj_ids, names, types, statuses = [], [], [], []
+        starts, ends, durations = [], [], []
+        budgets, costs, profits, roi_pcts = [], [], [], []
+        completion, risks, priorities, parts_col = [], [], [], []
+        completed = []
+        completed_value = ProjectStatus.COMPLETED.value
+
         for p in projects:
             parts = p.get("participating_departments") or []
             part_ids = [i.get("department_id") for i in parts if isinstance(i, dict)]
@@ -175,47 +482,57 @@ class BaseAnalyzer:
             financials = p.get("financials", {}) or {}
             metrics    = p.get("metrics", {}) or {}
 
-            start = self._to_datetime(timeline.get("start_date"))
-            end   = self._to_datetime(timeline.get("end_date"))
-            dur   = self._to_int(timeline.get("duration_days"))
-
-            if dur is None and start and end:
-                dur = (end - start).days
-
-            budget      = self._to_float(financials.get("budget"))
-            actual_cost = self._to_float(financials.get("actual_cost"))
-            profit      = self._to_float(financials.get("profit"))
-            roi_pct     = self._to_float(financials.get("roi_percentage"))
-
-            if roi_pct is not None:
-                roi_ratio = roi_pct / 100.0
-            elif (budget is not None and budget > 0 and profit is not None):
-                roi_ratio = profit / budget
-            else:
-                roi_ratio = None
-
-            rows.append({
-                "project_id": p.get("project_id"),
-                "name": p.get("name"),
-                "type": p.get("type") or p.get("project_type"), 
-                "status": p.get("status"),
-                "start_date": start,
-                "end_date": end,
-                "duration_days": dur,
-                "budget": budget,
-                "actual_cost": actual_cost,
-                "profit": profit,
-                "roi_ratio": roi_ratio,
-                "roi_pct": roi_pct,
-                "completion_percentage": self._to_int(metrics.get("completion_percentage")),
-                "risk_level": metrics.get("risk_level"),
-                "priority": metrics.get("priority"),
-                "participating_departments": parts,
-            })
-
-        df = pd.DataFrame(rows)
-        if not df.empty:
-            df["is_completed"] = df["status"].astype(str).str.lower().eq(ProjectStatus.COMPLETED.value)
+            status = p.get("status")
+
+            proj_ids.append(p.get("project_id"))
+            names.append(p.get("name"))
+            types.append(p.get("type") or p.get("project_type"))
+            statuses.append(status)
+            completed.append(isinstance(status, str) and status.lower() == completed_value)
+            starts.append(timeline.get("start_date"))
+            ends.append(timeline.get("end_date"))
+            durations.append(timeline.get("duration_days"))
+            budgets.append(financials.get("budget"))
+            costs.append(financials.get("actual_cost"))
+            profits.append(financials.get("profit"))
+            roi_pcts.append(financials.get("roi_percentage"))
+            completion.append(metrics.get("completion_percentage"))
+            risks.append(metrics.get("risk_level"))
+            priorities.append(metrics.get("priority"))
+            parts_col.append(parts)
+
+        start   = self._datetime_column(starts)
+        end     = self._datetime_column(ends)
+        budget  = self._float_column(budgets)
+        profit  = self._float_column(profits)
+        roi_pct = self._float_column(roi_pcts)
+
+        # ROI: explicit roi_percentage, else profit/budget
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roi_ratio = np.where(
+                ~np.isnan(roi_pct), roi_pct / 100.0,
+                np.where((budget > 0) & ~np.isnan(profit), profit / budget, np.nan),
+            )
+
+        df = pd.DataFrame({
+            "project_id": proj_ids,
+            "name": names,
+            "type": pd.Categorical(types),
+            "status": pd.Categorical(statuses),
+            "start_date": start,
+            "end_date": end,
+            "duration_days": self._downcast_column(self._duration_column(durations, start, end), "int32"),
+            "budget": budget,
+            "actual_cost": self._float_column(costs),
+            "profit": profit,
+            "roi_ratio": roi_ratio,
+            "roi_pct": roi_pct,
+            "completion_percentage": self._downcast_column(self._int_column(completion), "int16"),
+            "risk_level": pd.Categorical(risks),
+            "priority": pd.Categorical(priorities),
+            "participating_departments": parts_col,
+            "is_completed": np.asarray(completed, dtype=bool),
+        }, copy=False)
 
         self.logger.info(f"Projects DF built: {len(df)} rows with department_id={dep_id} participation")
         return df
@@ -227,21 +544,100 @@ class BaseAnalyzer:
         @return one of: ['dsc','phd','master','bachelor','none','other']
         """
         if value is None:
-            return Degree.NONE.value
-        s = str(value).strip().lower()
-        if s in DEGREE_MAP_RU:
-            return DEGREE_MAP_RU[s]
-        # Recognize simple English tokens
-        if s in ("phd", "msc", "master", "bachelor", "bs", "ms"):
-            return {
-                "phd": Degree.PHD.value,
-                "msc": Degree.MASTER.value,
-                "master": Degree.MASTER.value,
-                "ms": Degree.MASTER.value,
-                "bachelor": Degree.BACHELOR.value,
-                "bs": Degree.BACHELOR.value,
-            }[s]
-        return Degree.OTHER.value
+            return DEGREE_NONE
+        return DEGREE_LOOKUP.get(str(value).strip().lower(), DEGREE_OTHER)
+
+    @staticmethod
+    def _degree_column(values: List[Any]) -> np.ndarray:
+        """
+        @brief Vectorized _normalize_degree over a whole column.
+        @param values Raw education labels
+        @return np.ndarray of canonical degree strings
+        """
+        raw = pd.Series(values, dtype=object)
+        degree = (raw.astype(str).str.strip().str.lower()
+                     .map(DEGREE_LOOKUP).fillna(DEGREE_OTHER))
+        degree[raw.isna()] = DEGREE_NONE
+        return degree.to_numpy(dtype=object)
+
+    @staticmethod
+    def _float_column(values: List[Any]) -> np.ndarray:
+        """
+        @brief Vectorized _to_float: cast a raw column to float64, NaN if not possible.
+        """
+        num = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+        return num.to_numpy(dtype="float64", na_value=np.nan)
+
+    @staticmethod
+    def _to_f64(s: pd.Series) -> np.ndarray:
+        """
+        @brief Numeric column as a float64 array (NaN for missing/unparsable values).
+        @param s Column; numeric dtypes are cast directly, anything else goes through pd.to_numeric
+        @return np.ndarray float64
+        """
+        if s.dtype.kind in "fiu":
+            return s.to_numpy(dtype=np.float64, na_value=np.nan)
+        return pd.to_numeric(s, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+    @staticmethod
+    def _int_column(values: List[Any]) -> np.ndarray:
+        """
+        @brief Vectorized _to_int: int64 column, or truncated float64 if values are missing.
+        """
+        num = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+        if num.dtype.kind == "f":
+            num = np.trunc(num)
+            if not num.isna().any():
+                num = num.astype("int64")
+        return num.to_numpy()
+
+    @staticmethod
+    def _downcast_column(values: np.ndarray, int_dtype: str = "int32") -> np.ndarray:
+        """
+        @brief Narrow a numeric column: ints to int_dtype, floats (ints with gaps) to float32.
+        """
+        if values.dtype.kind in "iu":
+            return values.astype(int_dtype)
+        if values.dtype.kind == "f":
+            return values.astype("float32")
+        return values
+
+    @staticmethod
+    def _nullable_int_column(values: np.ndarray, int_dtype: str = "Int32") -> pd.api.extensions.ExtensionArray:
+        """
+        @brief Narrow an _int_column() result to a nullable pandas integer array (missing - <NA>).
+        @param values int64 or truncated float64 column
+        @param int_dtype nullable dtype name, e.g. "Int16"
+        """
+        if values.dtype.kind in "iu":
+            values = values.astype(int_dtype.lower())
+        return pd.array(values, dtype=int_dtype)
+
+    @staticmethod
+    def _datetime_column(values: List[Any]) -> pd.Series:
+        """
+        @brief Vectorized _to_datetime for ISO-8601 strings; NaT on failure.
+        """
+        return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce",
+                              format="ISO8601", cache=True)
+
+    @staticmethod
+    def _duration_column(values: List[Any], start: pd.Series, end: pd.Series) -> np.ndarray:
+        """
+        @brief Vectorized duration_days: explicit value, else (end - start) in days.
+        @param values raw duration_days values
+        @param start  parsed start dates (see _datetime_column)
+        @param end    parsed end dates
+        """
+        dur = BaseAnalyzer._int_column(values)
+        if dur.dtype.kind == "f":
+            missing = np.isnan(dur)
+            if missing.any():
+                span = (end - start).dt.days.to_numpy(dtype="float64", na_value=np.nan)
+                dur = np.where(missing, span, dur)
+                if not np.isnan(dur).any():
+                    dur = dur.astype("int64")
+        return dur
 
     def _to_datetime(self, v: Any) -> Optional[datetime]:
         """
@@ -283,11 +679,13 @@ class BaseAnalyzer:
     def safe_mean(series: pd.Series, default: float = 0.0) -> float:
         """
         @brief Mean with safe NaN/empty handling.
+        @note Reduces the float64 array directly (np.nansum / count), no dropna() copy.
         """
         if series is None:
             return float(default)
-        s = series.dropna()
-        return float(s.mean()) if len(s) else float(default)
+        arr = series.to_numpy(dtype="float64", na_value=np.nan)
+        n = np.count_nonzero(~np.isnan(arr))
+        return float(np.nansum(arr) / n) if n else float(default)
 
     @staticmethod
     def safe_sum(series: pd.Series, default: float = 0.0) -> float:
@@ -296,5 +694,77 @@ class BaseAnalyzer:
         """
         if series is None:
             return float(default)
-        s = series.dropna()
-        return float(s.sum()) if len(s) else float(default)
+        arr = series.to_numpy(dtype="float64", na_value=np.nan)
+        return float(np.nansum(arr)) if (~np.isnan(arr)).any() else float(default)
+
+    @staticmethod
+    def _save(fig, path: str, dpi: int = 130) -> str:
+        """
+        @brief Lay out and write a plot figure in one render pass, as an opaque RGB PNG.
+        @param fig  matplotlib Figure with an Agg canvas
+        @param path Output PNG path
+        @param dpi  Output resolution
+        @return str path to saved image
+        @note Agg writes RGBA PNGs, and fpdf splits their alpha channel pixel by pixel in
+              Python when embedding them (most of the export time); the figures are opaque,
+              so dropping the channel loses nothing.
+        """
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=dpi)
+        buf.seek(0)
+        with Image.open(buf) as im:
+            im.convert("RGB").save(path, format="PNG")
+        return path
+
+    @staticmethod
+    def _run_plot(job: Tuple) -> str:
+        """
+        @brief Render one plot job in the current process.
+        @param job (render function, path, *args)
+        @return str path of the saved image
+        """
+        render, path = job[0], job[1]
+        render(path, *job[2:])
+        return path
+
+    def _submit_plot(self, job: Tuple) -> Future:
+        """
+        @brief Render one plot job on a background thread.
+        @param job (render function, path, *args); the renderer must use its own Agg figure
+        @return Future resolving to the saved path (call .result() before using the file)
+        """
+        return self._plot_pool().submit(BaseAnalyzer._run_plot, job)
+
+    def _plot_pool(self) -> ThreadPoolExecutor:
+        """
+        @brief The analyzer's plot thread pool, created on first use.
+        @note Anything submitted must draw on its own (per-thread) Agg figure.
+        """
+        if self._plot_executor is None:
+            self._plot_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                     thread_name_prefix="plot")
+        return self._plot_executor
+
+    def _shutdown_plot_pool(self) -> None:
+        """
+        @brief Wait for and stop the plot threads; the next _plot_pool() call starts a new pool.
+        @note Called by plot_all(), so a reused worker process does not keep idle threads alive
+              (forking with live threads can deadlock).
+        """
+        if self._plot_executor is not None:
+            self._plot_executor.shutdown(wait=True)
+            self._plot_executor = None
+
+    def _run_plots(self, jobs: List[Tuple]) -> List[str]:
+        """
+        @brief Render plot jobs concurrently on the plot thread pool and wait for all of them.
+        @param jobs List of (render function, path, *args)
+        @return list of paths in the order of jobs
+        @note The pool is shut down afterwards, whether or not a render failed.
+        """
+        try:
+            futures = [self._submit_plot(job) for job in jobs]
+            return [fut.result() for fut in futures]
+        finally:
+            self._shutdown_plot_pool()
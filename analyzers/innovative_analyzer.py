@@ -5,19 +5,30 @@
        compares by average ROI, and estimates typical payback for R&D.
 """
 
-from typing import Dict, Any, Iterable, Set, List
+from typing import Dict, Any, Iterable, FrozenSet, List, Tuple
 import os
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
-from analyzers.base_rnd_analyzer import BaseAnalyzer
+from analyzers.base_rnd_analyzer import BaseAnalyzer, new_axes, render_empty
+from analyzers._kernels import compute_roi_payback
+from config.enums import ProjectStatus
 from config.messages import HEAD_INNOVATION, ReportMsg, LogMsg
+from utilits.io import ensure_dir
 
 
 # Description of departments by id
-RESEARCH_DEPS: Set[int]   = {26, 27, 28, 29, 30}
-COMMERCIAL_DEPS: Set[int] = {17, 18, 19, 20}
+RESEARCH_DEPS: FrozenSet[int]   = frozenset({26, 27, 28, 29, 30})
+COMMERCIAL_DEPS: FrozenSet[int] = frozenset({17, 18, 19, 20})
+
+# Cohort labels, in report order
+COHORTS: Tuple[str, str] = ("R&D", "Commercial")
+
+# Columns of the per-project ROI table
+ROI_TABLE_COLUMNS: List[str] = [
+    "project_id","name","status","duration_days","budget","actual_cost","profit",
+    "roi_ratio","roi_pct","payback_days","is_research","is_commercial"
+]
 
 
 class InnovativeAnalyzer(BaseAnalyzer):
@@ -29,6 +40,9 @@ class InnovativeAnalyzer(BaseAnalyzer):
            - typical R&D payback (median payback_days).
     """
 
+    # @brief Resolution for histogram PNGs (bars/scatter keep 130)
+    HIST_DPI: int = 100
+
     def execute_analysis(self) -> Dict[str, Any]:
         """
         @brief Run the R&D vs Commercial effectiveness pipeline on all projects.
@@ -38,10 +52,7 @@ class InnovativeAnalyzer(BaseAnalyzer):
 
         df = self._projects_df()
         if df.empty:
-            empty_tbl = pd.DataFrame(columns=[
-                "project_id","name","status","duration_days","budget","actual_cost","profit",
-                "roi_ratio","roi_pct","payback_days","is_research","is_commercial"
-            ])
+            empty_tbl = pd.DataFrame(columns=ROI_TABLE_COLUMNS)
             empty_summary = pd.DataFrame(columns=[
                 "type","projects","avg_roi_ratio","avg_roi_pct",
                 "overall_roi_ratio","overall_roi_pct",
@@ -56,43 +67,24 @@ class InnovativeAnalyzer(BaseAnalyzer):
                 "typical_payback_research_days": None,
             }
 
-        rnd_df  = df[df["is_research"]].copy()
-        comm_df = df[df["is_commercial"]].copy()
-
-        rnd_summary  = self._cohort_summary(rnd_df)
-        comm_summary = self._cohort_summary(comm_df)
-
-        cohort_summary_df = pd.DataFrame([
-            {"type": "R&D", "projects": rnd_summary["projects"],
-             "avg_roi_ratio": rnd_summary["avg_roi_ratio"],
-             "avg_roi_pct": rnd_summary["avg_roi_pct"],
-             "overall_roi_ratio": rnd_summary["overall_roi_ratio"],
-             "overall_roi_pct": rnd_summary["overall_roi_pct"],
-             "median_payback_days": rnd_summary["median_payback_days"],
-             "success_rate_pct": rnd_summary["success_rate_pct"],
-             "profit_sum": rnd_summary["profit_sum"], "cost_sum": rnd_summary["cost_sum"]},
-            {"type": "Commercial", "projects": comm_summary["projects"],
-             "avg_roi_ratio": comm_summary["avg_roi_ratio"],
-             "avg_roi_pct": comm_summary["avg_roi_pct"],
-             "overall_roi_ratio": comm_summary["overall_roi_ratio"],
-             "overall_roi_pct": comm_summary["overall_roi_pct"],
-             "median_payback_days": comm_summary["median_payback_days"],
-             "success_rate_pct": comm_summary["success_rate_pct"],
-             "profit_sum": comm_summary["profit_sum"], "cost_sum": comm_summary["cost_sum"]},
-        ])[["type","projects","avg_roi_ratio","avg_roi_pct",
-            "overall_roi_ratio","overall_roi_pct",
-            "median_payback_days","success_rate_pct","profit_sum","cost_sum"]]
+        cohort_summary_df = self._cohort_summary(df)
+        rnd_summary  = cohort_summary_df.loc["R&D"]
+        comm_summary = cohort_summary_df.loc["Commercial"]
+        cohort_summary_df = cohort_summary_df.reset_index()
+
+        # roi_pct is roi_ratio * 100, so a single descending key is enough; NaN sorts last
+        roi = df["roi_ratio"].to_numpy(dtype="float64", na_value=np.nan)
+        order = np.argsort(-np.nan_to_num(roi, nan=-np.inf), kind="stable")
+        roi_table = df.iloc[order, df.columns.get_indexer(ROI_TABLE_COLUMNS)]
+        roi_table.index = pd.RangeIndex(len(roi_table))
 
         result = {
             "title": HEAD_INNOVATION,
-            "roi_by_project": df.loc[:, [
-                "project_id","name","status","duration_days","budget","actual_cost","profit",
-                "roi_ratio","roi_pct","payback_days","is_research","is_commercial"
-            ]].sort_values(["roi_ratio","roi_pct"], ascending=[False, False], na_position="last").reset_index(drop=True),
+            "roi_by_project": roi_table,
             "cohort_summary": cohort_summary_df,
-            "overall_roi_research": round(rnd_summary["overall_roi_ratio"], 4) if np.isfinite(rnd_summary["overall_roi_ratio"]) else 0.0,
-            "overall_roi_commercial": round(comm_summary["overall_roi_ratio"], 4) if np.isfinite(comm_summary["overall_roi_ratio"]) else 0.0,
-            "typical_payback_research_days": round(rnd_summary["median_payback_days"], 1) if np.isfinite(rnd_summary["median_payback_days"]) else None,
+            "overall_roi_research": round(float(rnd_summary["overall_roi_ratio"]), 4) if np.isfinite(rnd_summary["overall_roi_ratio"]) else 0.0,
+            "overall_roi_commercial": round(float(comm_summary["overall_roi_ratio"]), 4) if np.isfinite(comm_summary["overall_roi_ratio"]) else 0.0,
+            "typical_payback_research_days": round(float(rnd_summary["median_payback_days"]), 1) if np.isfinite(rnd_summary["median_payback_days"]) else None,
         }
 
         self.logger.info(LogMsg.ANALYSIS_COMPLETE.format("Innovation Effectiveness (global cohorts)"))
@@ -134,26 +126,24 @@ class InnovativeAnalyzer(BaseAnalyzer):
         self._ensure_dir(out_dir)
         summary = result.get("cohort_summary")
         if not isinstance(summary, pd.DataFrame) or summary.empty:
-            return os.path.join(out_dir, "innovation_cohort_roi_bars.png")
+            return render_empty(os.path.join(out_dir, "innovation_cohort_roi_bars.png"),
+                                  "R&D vs Commercial - ROI (no data)")
 
         x = summary["type"]
         avg = summary["avg_roi_ratio"]
         ovl = summary["overall_roi_ratio"]
 
-        plt.figure()
+        fig, ax = new_axes()
         width = 0.35
         idx = np.arange(len(x))
-        plt.bar(idx - width/2, avg, width, label="Average ROI")
-        plt.bar(idx + width/2, ovl, width, label="Overall ROI")
-        plt.xticks(idx, x)
-        plt.ylabel("ROI (ratio)")
-        plt.title("R&D vs Commercial - ROI (average vs overall)")
-        plt.legend()
+        ax.bar(idx - width/2, avg, width, label="Average ROI")
+        ax.bar(idx + width/2, ovl, width, label="Overall ROI")
+        ax.set_xticks(idx, x)
+        ax.set_ylabel("ROI (ratio)")
+        ax.set_title("R&D vs Commercial - ROI (average vs overall)")
+        ax.legend()
         path = os.path.join(out_dir, "innovation_cohort_roi_bars.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        return self._save(fig, path)
 
     def plot_roi_hist_by_cohort(self, out_dir: str = "plots", bins: int = 10) -> str:
         """
@@ -167,18 +157,15 @@ class InnovativeAnalyzer(BaseAnalyzer):
         rnd = pd.to_numeric(df.loc[df["is_research"], "roi_ratio"], errors="coerce").dropna()
         com = pd.to_numeric(df.loc[df["is_commercial"], "roi_ratio"], errors="coerce").dropna()
 
-        plt.figure()
-        plt.hist(rnd, bins=bins, alpha=0.6, label="R&D")
-        plt.hist(com, bins=bins, alpha=0.6, label="Commercial")
-        plt.xlabel("ROI (ratio)")
-        plt.ylabel("Projects")
-        plt.title("Per-project ROI distribution by cohort")
-        plt.legend()
+        fig, ax = new_axes()
+        ax.hist(rnd, bins=bins, alpha=0.6, label="R&D")
+        ax.hist(com, bins=bins, alpha=0.6, label="Commercial")
+        ax.set_xlabel("ROI (ratio)")
+        ax.set_ylabel("Projects")
+        ax.set_title("Per-project ROI distribution by cohort")
+        ax.legend()
         path = os.path.join(out_dir, "innovation_roi_hist.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        return self._save(fig, path, dpi=self.HIST_DPI)
 
     def plot_payback_hist_rnd(self, out_dir: str = "plots", bins: int = 10) -> str:
         """
@@ -191,16 +178,13 @@ class InnovativeAnalyzer(BaseAnalyzer):
         df = self._projects_df()
         pay = pd.to_numeric(df.loc[df["is_research"], "payback_days"], errors="coerce").dropna()
 
-        plt.figure()
-        plt.hist(pay, bins=bins)
-        plt.xlabel("Payback, days")
-        plt.ylabel("Projects")
-        plt.title("R&D - Payback distribution")
+        fig, ax = new_axes()
+        ax.hist(pay, bins=bins)
+        ax.set_xlabel("Payback, days")
+        ax.set_ylabel("Projects")
+        ax.set_title("R&D - Payback distribution")
         path = os.path.join(out_dir, "innovation_rnd_payback_hist.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        return self._save(fig, path, dpi=self.HIST_DPI)
 
     def plot_roi_vs_duration_scatter(self, out_dir: str = "plots") -> str:
         """
@@ -209,167 +193,201 @@ class InnovativeAnalyzer(BaseAnalyzer):
         @return str path to saved PNG
         """
         self._ensure_dir(out_dir)
-        df = self._projects_df().copy()
-        df["roi_ratio"] = pd.to_numeric(df["roi_ratio"], errors="coerce")
-        df["duration_days"] = pd.to_numeric(df["duration_days"], errors="coerce")
-
-        plt.figure()
-        plt.scatter(df.loc[df["is_research"], "duration_days"],
-                    df.loc[df["is_research"], "roi_ratio"], alpha=0.8, label="R&D")
-        plt.scatter(df.loc[df["is_commercial"], "duration_days"],
-                    df.loc[df["is_commercial"], "roi_ratio"], alpha=0.8, label="Commercial")
-        plt.xlabel("Duration, days")
-        plt.ylabel("ROI (ratio)")
-        plt.title("ROI vs Duration by cohort")
-        plt.legend()
+        df = self._projects_df()
+
+        fig, ax = new_axes()
+        ax.scatter(df.loc[df["is_research"], "duration_days"],
+                   df.loc[df["is_research"], "roi_ratio"], alpha=0.8, label="R&D")
+        ax.scatter(df.loc[df["is_commercial"], "duration_days"],
+                   df.loc[df["is_commercial"], "roi_ratio"], alpha=0.8, label="Commercial")
+        ax.set_xlabel("Duration, days")
+        ax.set_ylabel("ROI (ratio)")
+        ax.set_title("ROI vs Duration by cohort")
+        ax.legend()
         path = os.path.join(out_dir, "innovation_scatter_roi_duration.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        return self._save(fig, path)
 
+    def plot_all(self, result: Dict[str, Any], out_dir: str = "plots", bins: int = 10) -> List[str]:
+        """
+        @brief Render all four innovation plots concurrently on the plot thread pool.
+        @param result  Dict from execute_analysis()
+        @param out_dir Output directory
+        @param bins    Histogram bins
+        @return [cohort ROI bars, ROI histogram, payback histogram, ROI vs duration scatter] paths
+        """
+        self._ensure_dir(out_dir)
+        self._projects_df()  # build the shared table once, before the threads read it
+        pool = self._plot_pool()
+        try:
+            futures = [
+                pool.submit(self.plot_cohort_roi_bars, result, out_dir),
+                pool.submit(self.plot_roi_hist_by_cohort, out_dir, bins),
+                pool.submit(self.plot_payback_hist_rnd, out_dir, bins),
+                pool.submit(self.plot_roi_vs_duration_scatter, out_dir),
+            ]
+            return [fut.result() for fut in futures]
+        finally:
+            self._shutdown_plot_pool()
 
     def _projects_df(self) -> pd.DataFrame:
+        """
+        @brief Project DataFrame with cohort flags and ROI/payback, built once per raw data.
+        @return pd.DataFrame (cached on the instance - do not mutate)
+        @note Rebuilt only if self.raw is reassigned.
+        """
+        cache = getattr(self, "_projects_df_cache", None)
+        if cache is None or cache[0] is not self.raw:
+            cache = (self.raw, self._build_cohort_projects_df())
+            self._projects_df_cache = cache
+        return cache[1]
+
+    def _build_cohort_projects_df(self) -> pd.DataFrame:
         """
         @brief Build project DataFrame from raw JSON with cohort flags and ROI/payback computed.
         @return pd.DataFrame
         """
-        rows = []
+        proj_ids, names, statuses = [], [], []
+        starts, ends, durations = [], [], []
+        budgets, costs, profits, roi_pcts = [], [], [], []
+        is_research, is_commercial, completed = [], [], []
+
+        # Loop invariants, bound once instead of per project
+        completed_value = ProjectStatus.COMPLETED.value
+        cohort_flags = self._cohort_flags
+
         for p in (self.raw.projects or []):
-            parts = p.get("participating_departments") or []
-            dep_ids = self._extract_dep_ids(parts)
+            is_r, is_c = cohort_flags(p.get("participating_departments"))
 
             timeline   = p.get("timeline", {}) or {}
             financials = p.get("financials", {}) or {}
-            metrics    = p.get("metrics", {}) or {}
-
-            start = self._to_dt(timeline.get("start_date"))
-            end   = self._to_dt(timeline.get("end_date"))
-            dur   = self._safe_int(timeline.get("duration_days"))
-            if dur is None and (start is not None) and (end is not None):
-                dur = int((end - start).days)
-
-            budget      = self._to_float(financials.get("budget"))
-            actual_cost = self._to_float(financials.get("actual_cost"))
-            profit      = self._to_float(financials.get("profit"))
-            roi_pct     = self._to_float(financials.get("roi_percentage"))
-
-            rows.append({
-                "project_id": p.get("project_id"),
-                "name": p.get("name"),
-                "status": p.get("status"),
-                "duration_days": dur,
-                "budget": budget,
-                "actual_cost": actual_cost,
-                "profit": profit,
-                "roi_pct_explicit": roi_pct,
-                "is_research": bool(dep_ids & RESEARCH_DEPS),
-                "is_commercial": bool(dep_ids & COMMERCIAL_DEPS),
-            })
-
-        df = pd.DataFrame(rows)
+
+            status = p.get("status")
+
+            proj_ids.append(p.get("project_id"))
+            names.append(p.get("name"))
+            statuses.append(status)
+            starts.append(timeline.get("start_date"))
+            ends.append(timeline.get("end_date"))
+            durations.append(timeline.get("duration_days"))
+            budgets.append(financials.get("budget"))
+            costs.append(financials.get("actual_cost"))
+            profits.append(financials.get("profit"))
+            roi_pcts.append(financials.get("roi_percentage"))
+            is_research.append(is_r)
+            is_commercial.append(is_c)
+            # Success flag (for summaries)
+            completed.append(isinstance(status, str) and status.lower() == completed_value)
+
+        df = pd.DataFrame({
+            "project_id": proj_ids,
+            "name": names,
+            "status": pd.Categorical(statuses),
+            "duration_days": self._downcast_column(self._duration_column(
+                durations, self._datetime_column(starts), self._datetime_column(ends)), "int32"),
+            # raw financial values, converted once per column (NaN if not numeric)
+            "budget": self._float_column(budgets),
+            "actual_cost": self._float_column(costs),
+            "profit": self._float_column(profits),
+            "roi_pct_explicit": self._float_column(roi_pcts),
+            "is_research": np.asarray(is_research, dtype=bool),
+            "is_commercial": np.asarray(is_commercial, dtype=bool),
+            "is_completed": np.asarray(completed, dtype=bool),
+        }, copy=False)
 
         if df.empty:
             return df
 
-        # Numerics
-        for col in ["budget","actual_cost","profit","duration_days","roi_pct_explicit"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        # ROI per project: roi_pct - profit/actual - profit/budget
-        df["roi_ratio"] = np.nan
-        has_explicit = df["roi_pct_explicit"].notna()
-        mask_actual  = (~has_explicit) & df["actual_cost"].notna() & (df["actual_cost"] > 0) & df["profit"].notna()
-        mask_budget  = (~has_explicit) & (~mask_actual) & df["budget"].notna() & (df["budget"] > 0) & df["profit"].notna()
+        budget = df["budget"].to_numpy(dtype="float64", na_value=np.nan)
+        cost   = df["actual_cost"].to_numpy(dtype="float64", na_value=np.nan)
+        profit = df["profit"].to_numpy(dtype="float64", na_value=np.nan)
+        pct    = df["roi_pct_explicit"].to_numpy(dtype="float64", na_value=np.nan)
+        dur    = df["duration_days"].to_numpy(dtype="float64", na_value=np.nan)
 
-        df.loc[has_explicit, "roi_ratio"] = df.loc[has_explicit, "roi_pct_explicit"] / 100.0
-        df.loc[mask_actual,  "roi_ratio"] = df.loc[mask_actual,  "profit"] / df.loc[mask_actual,  "actual_cost"]
-        df.loc[mask_budget,  "roi_ratio"] = df.loc[mask_budget,  "profit"] / df.loc[mask_budget,  "budget"]
-        df["roi_pct"] = df["roi_ratio"] * 100.0
+        roi = np.empty(budget.size, dtype="float64")
+        payback = np.empty(budget.size, dtype="float64")
+        compute_roi_payback(pct, cost, budget, profit, dur, roi, payback)
 
-        # Payback: budget / (profit/day) when daily profit is positive
-        daily_profit = df["profit"] / df["duration_days"].replace(0, np.nan)
-        can_payback = (df["budget"] > 0) & daily_profit.notna() & (daily_profit > 0)
-        df["payback_days"] = np.where(can_payback, df["budget"] / daily_profit, np.nan)
-
-        # Success flag (for summaries)
-        df["is_completed"] = df["status"].astype(str).str.lower().eq("completed")
+        df["roi_ratio"] = roi
+        df["roi_pct"] = roi * 100.0
+        df["payback_days"] = payback
+        # Cost base: prefer actual_cost, else budget
+        df["cost_base"] = np.where(np.isnan(cost), budget, cost)
 
         return df
 
-    def _cohort_summary(self, sub: pd.DataFrame) -> Dict[str, float]:
+    def _cohort_summary(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        @brief Compute metrics: avg & aggregate ROI, median payback, success rate.
-        @param sub projects DataFrame
-        @return dict metrics
+        @brief Compute per-cohort metrics: avg & aggregate ROI, median payback, success rate.
+        @param df projects DataFrame (from _projects_df)
+        @return pd.DataFrame indexed by "type" (R&D, Commercial)
+        @note Cohorts may overlap, so each cohort's rows are stacked under its own label
+              and aggregated in a single groupby; empty cohorts still get a row.
         """
-        if sub.empty:
-            return dict(projects=0, profit_sum=0.0, cost_sum=0.0,
-                        avg_roi_ratio=np.nan, avg_roi_pct=np.nan,
-                        overall_roi_ratio=np.nan, overall_roi_pct=np.nan,
-                        median_payback_days=np.nan, success_rate_pct=np.nan)
-
-        # Cost base: prefer actual_cost, else budget
-        cost_base = np.where(sub["actual_cost"].notna(), sub["actual_cost"], sub["budget"]).astype(float)
-        cost_sum = float(np.nan_to_num(cost_base, nan=0.0).sum())
-        profit_sum = float(sub["profit"].fillna(0).sum())
-
-        overall_ratio = float(profit_sum / cost_sum) if cost_sum > 0 else np.nan
-        avg_ratio = float(sub["roi_ratio"].mean())
-        median_payback = float(sub["payback_days"].median()) if sub["payback_days"].notna().any() else np.nan
-        success_rate = float(sub["is_completed"].mean() * 100.0)
-
-        return dict(projects=int(len(sub)),
-                    profit_sum=profit_sum, cost_sum=cost_sum,
-                    avg_roi_ratio=avg_ratio, avg_roi_pct=avg_ratio*100.0 if np.isfinite(avg_ratio) else np.nan,
-                    overall_roi_ratio=overall_ratio, overall_roi_pct=overall_ratio*100.0 if np.isfinite(overall_ratio) else np.nan,
-                    median_payback_days=median_payback, success_rate_pct=success_rate)
+        rnd_idx  = np.flatnonzero(df["is_research"].to_numpy())
+        comm_idx = np.flatnonzero(df["is_commercial"].to_numpy())
+
+        union = df.iloc[np.concatenate([rnd_idx, comm_idx])]
+
+        union = pd.DataFrame({
+            "type": pd.Categorical.from_codes(
+                np.repeat([0, 1], [rnd_idx.size, comm_idx.size]), categories=COHORTS),
+            "profit": union["profit"].to_numpy(),
+            "cost_base": union["cost_base"].to_numpy(),
+            "roi_ratio": union["roi_ratio"].to_numpy(),
+            "payback_days": union["payback_days"].to_numpy(),
+            "is_completed": union["is_completed"].to_numpy(),
+        }, copy=False)
+
+        agg = union.groupby("type", observed=False).agg(
+            projects=("roi_ratio", "size"),
+            avg_roi_ratio=("roi_ratio", "mean"),
+            median_payback_days=("payback_days", "median"),
+            success_rate=("is_completed", "mean"),
+            profit_sum=("profit", "sum"),
+            cost_sum=("cost_base", "sum"),
+        )
+        agg.index = pd.Index(COHORTS, name="type")
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg = agg["avg_roi_ratio"].to_numpy()
+            overall = np.where(agg["cost_sum"] > 0, agg["profit_sum"] / agg["cost_sum"], np.nan)
+
+            agg["avg_roi_pct"] = np.where(np.isfinite(avg), avg * 100.0, np.nan)
+            agg["overall_roi_ratio"] = overall
+            agg["overall_roi_pct"] = np.where(np.isfinite(overall), overall * 100.0, np.nan)
+            agg["success_rate_pct"] = agg["success_rate"].to_numpy(dtype="float64") * 100.0
+
+        return agg[["projects","avg_roi_ratio","avg_roi_pct",
+                    "overall_roi_ratio","overall_roi_pct",
+                    "median_payback_days","success_rate_pct","profit_sum","cost_sum"]]
 
     @staticmethod
-    def _extract_dep_ids(parts: Iterable[dict]) -> Set[int]:
+    def _cohort_flags(parts: Iterable[dict]) -> Tuple[bool, bool]:
         """
-        @brief Extract integer department_id set.
+        @brief Test whether a project touches R&D and/or Commercial departments.
         @param parts Iterable of dicts from JSON
-        @return set of department ids
+        @return (is_research, is_commercial)
+        @note Single pass with early exit; no per-project set is built.
         """
-        ids: Set[int] = set()
+        is_r = is_c = False
         for it in parts or []:
-            if isinstance(it, dict) and "department_id" in it:
+            if not isinstance(it, dict):
+                continue
+            d = it.get("department_id")
+            if d is None:
+                continue
+            if type(d) is not int:
                 try:
-                    ids.add(int(it["department_id"]))
+                    d = int(d)
                 except Exception:
                     continue
-        return ids
-
-    @staticmethod
-    def _to_dt(v):
-        """
-        @brief Safe datetime parser; returns NaT/None on failure.
-        """
-        try:
-            return pd.to_datetime(v, errors="coerce")
-        except Exception:
-            return None
-
-    @staticmethod
-    def _safe_int(v):
-        """
-        @brief Safe int cast; returns None if not possible.
-        """
-        try:
-            return int(v) if v is not None else None
-        except Exception:
-            return None
-
-    @staticmethod
-    def _to_float(v):
-        """
-        @brief Safe float cast; returns None if not possible.
-        """
-        try:
-            return float(v) if v is not None else None
-        except Exception:
-            return None
+            if d in RESEARCH_DEPS:
+                is_r = True
+            elif d in COMMERCIAL_DEPS:
+                is_c = True
+            if is_r and is_c:
+                break
+        return is_r, is_c
 
     @staticmethod
     def _ensure_dir(path: str) -> None:
@@ -377,5 +395,4 @@ class InnovativeAnalyzer(BaseAnalyzer):
         @brief Ensure output directory exists.
         @param path Directory path to create if missing
         """
-        if path:
-            os.makedirs(path, exist_ok=True)
+        ensure_dir(path)
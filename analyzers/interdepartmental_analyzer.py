@@ -5,15 +5,67 @@ top-5 partners by co-participation frequency,
 effectiveness of joint projects by ROI.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Tuple
+import itertools
 import os
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
-from analyzers.base_rnd_analyzer import BaseAnalyzer
+from analyzers.base_rnd_analyzer import BaseAnalyzer, new_axes, render_empty
+from analyzers._kernels import partner_roi
 from config.messages import HEAD_COLLAB, ReportMsg, LogMsg
 from config.enums import Thresholds
+from utilits.io import ensure_dir
+
+
+class PreparedProjects(NamedTuple):
+    """
+    @brief Projects data normalized once per analyzer; arrays are aligned with df rows.
+    """
+    df: pd.DataFrame
+    is_joint: np.ndarray
+    ids_per_row: List[Tuple[int, ...]]
+    id_sets: List[FrozenSet[int]]
+    budget: np.ndarray
+    actual_cost: np.ndarray
+    profit: np.ndarray
+    roi_pct: np.ndarray
+
+
+# Module-level renderers; each draws on the per-thread figure and returns the saved path
+def _render_collab_pie(path: str, solo: int, joint: int, figsize: Tuple[float, float]) -> str:
+    """
+    @brief Draw and save the solo vs joint pie.
+    """
+    fig, ax = new_axes(figsize=figsize)
+    ax.pie([solo, joint], labels=["Solo", "Joint"], autopct="%1.1f%%", startangle=90)
+    ax.set_title("Collaboration rate (solo vs joint)")
+    return BaseAnalyzer._save(fig, path)
+
+
+def _render_partner_bars(path: str, names: List[str], values: np.ndarray, ylabel: str, title: str) -> str:
+    """
+    @brief Draw and save a TOP-5 partners bar chart.
+    """
+    fig, ax = new_axes()
+    ax.bar(names, values)
+    for label in ax.get_xticklabels():
+        label.set(rotation=30, ha="right")
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    return BaseAnalyzer._save(fig, path)
+
+
+def _render_roi_hist(path: str, roi: np.ndarray, bins: int) -> str:
+    """
+    @brief Draw and save the joint-project ROI histogram.
+    """
+    fig, ax = new_axes()
+    ax.hist(roi, bins=bins)
+    ax.set_xlabel("ROI (ratio)")
+    ax.set_ylabel("Projects")
+    ax.set_title("Joint projects - ROI distribution")
+    return BaseAnalyzer._save(fig, path)
 
 
 class InterdepartmentalAnalyzer(BaseAnalyzer):
@@ -22,6 +74,9 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
     @brief “Interdepartmental interaction” and the effectiveness of joint projects by ROI
 """
 
+    # @brief Pie is pre-sized instead of cropped with bbox_inches="tight" (which needs a second render)
+    PIE_FIGSIZE: Tuple[float, float] = (5.0, 4.0)
+
     def execute_analysis(self) -> Dict[str, Any]:
         """
         @brief Run the interdepartmental collaboration pipeline.
@@ -29,7 +84,7 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
     """
         self.logger.info(LogMsg.ANALYSIS_START.format("Interdepartmental Collaboration"))
 
-        prj = self.projects_df()
+        prj = self.projects_df(copy=False)
         if prj is None or prj.empty:
             empty = pd.DataFrame(columns=[
                 "partner_department_id","partner_department_name",
@@ -43,19 +98,19 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
                 "partners_by_roi": empty,
             }
 
-        for col in ("participating_departments", "is_completed", "budget", "actual_cost",
-                    "profit", "roi_pct", "duration_days"):
-            if col not in prj.columns:
-                prj[col] = np.nan
+        prep = self._prepared()
+        prj = prep.df
 
         # mark joint projects
         self.logger.info(LogMsg.METRIC_START.format("collaboration_rate_percent"))
-        part_counts = prj["participating_departments"].apply(self._safe_participants_len)
-        is_joint = part_counts >= int(Thresholds.JOINT_MIN_DEPTS)
-        collab_rate = float(is_joint.mean() * 100.0) if len(prj) else 0.0
+        is_joint = prep.is_joint
+        collab_rate = float(np.count_nonzero(is_joint)) / is_joint.size * 100.0 if is_joint.size else 0.0
         self.logger.info(LogMsg.METRIC_DONE.format("collaboration_rate_percent", f"{collab_rate:.1f}%"))
 
-        joint_df = prj.loc[is_joint].copy()
+        joint_df = prj.loc[is_joint]
+        joint_rows = np.flatnonzero(is_joint)
+        joint_ids = [prep.ids_per_row[i] for i in joint_rows]
+        joint_sets = [prep.id_sets[i] for i in joint_rows]
         if joint_df.empty:
             empty = pd.DataFrame(columns=[
                 "partner_department_id","partner_department_name",
@@ -69,47 +124,25 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
                 "partners_by_roi": empty,
             }
 
-        #ROI per project
-        joint_df["budget"] = pd.to_numeric(joint_df["budget"], errors="coerce")
-        joint_df["actual_cost"] = pd.to_numeric(joint_df["actual_cost"], errors="coerce")
-        joint_df["profit"] = pd.to_numeric(joint_df["profit"], errors="coerce")
-        joint_df["roi_pct"] = pd.to_numeric(joint_df["roi_pct"], errors="coerce")
-
-        joint_df["roi_ratio"] = np.nan
-        has_explicit = joint_df["roi_pct"].notna()
-        mask_actual = (~has_explicit) & joint_df["actual_cost"].notna() & (joint_df["actual_cost"] > 0) & joint_df["profit"].notna()
-        mask_budget = (~has_explicit) & (~mask_actual) & joint_df["budget"].notna() & (joint_df["budget"] > 0) & joint_df["profit"].notna()
-
-        joint_df.loc[has_explicit, "roi_ratio"] = joint_df.loc[has_explicit, "roi_pct"] / 100.0
-        joint_df.loc[mask_actual,  "roi_ratio"] = joint_df.loc[mask_actual,  "profit"] / joint_df.loc[mask_actual,  "actual_cost"]
-        joint_df.loc[mask_budget,  "roi_ratio"] = joint_df.loc[mask_budget,  "profit"] / joint_df.loc[mask_budget,  "budget"]
-        joint_df["roi_pct"] = joint_df["roi_ratio"] * 100.0
+        budget, actual, profit = (arr[is_joint] for arr in (prep.budget, prep.actual_cost, prep.profit))
 
         #Overall ROI for all joint projects (aggregate)
-        cost_base = np.where(joint_df["actual_cost"].notna(), joint_df["actual_cost"], joint_df["budget"])
-        cost_sum = float(pd.Series(cost_base, index=joint_df.index).astype(float).fillna(0).sum())
-        profit_sum = float(joint_df["profit"].fillna(0).sum())
+        cost_base = np.where(np.isnan(actual), budget, actual)
+        cost_sum = float(np.nansum(cost_base))
+        profit_sum = float(np.nansum(profit))
         joint_overall_roi = float(profit_sum / cost_sum) if cost_sum > 0 else 0.0
         dep_name_map = self._department_name_map()
-        partners_rows: List[Tuple[int, str, int, int]] = []
+        dep_id = self.department_id
 
-        for _, proj in joint_df.iterrows():
-            parts = self._safe_participants_ids(proj.get("participating_departments"))
-            for pid in parts:
-                if pid == self.department_id:
-                    continue
-                partners_rows.append((
-                    pid,
-                    dep_name_map.get(pid, f"Department {pid}"),
-                    1,
-                    int(bool(proj.get("is_completed")))
-                ))
-
-        partners_df = pd.DataFrame(partners_rows, columns=[
-            "partner_department_id","partner_department_name","joint_projects","joint_completed"
-        ])
+        # One row per (joint project, partner) occurrence, built from the cached id tuples
+        lens = np.fromiter(map(len, joint_ids), dtype=np.int64, count=len(joint_ids))
+        pids_flat = np.fromiter(itertools.chain.from_iterable(joint_ids),
+                                dtype=np.int64, count=int(lens.sum()))
+        completed = joint_df["is_completed"].fillna(False).astype(bool).to_numpy()
+        completed_flat = np.repeat(completed, lens)
+        keep = pids_flat != dep_id
 
-        if partners_df.empty:
+        if not keep.any():
             empty = pd.DataFrame(columns=[
                 "partner_department_id","partner_department_name",
                 "joint_projects","joint_completed","overall_roi_ratio","overall_roi_pct"
@@ -122,41 +155,46 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
                 "partners_by_roi": empty,
             }
 
-        agg_freq = (partners_df
-                    .groupby(["partner_department_id","partner_department_name"], as_index=False)
-                    .agg({"joint_projects":"sum","joint_completed":"sum"}))
-
-        # For ROI by partner, take all projects where this partner was together with other department
-        rows_roi = []
-        for pid, row in agg_freq.set_index("partner_department_id").iterrows():
-            mask = joint_df["participating_departments"].apply(
-                lambda L: self.department_id in self._safe_participants_ids(L) and pid in self._safe_participants_ids(L)
-            )
-            sub = joint_df.loc[mask].copy()
-            if sub.empty:
-                overall = np.nan
-            else:
-                base = np.where(sub["actual_cost"].notna(), sub["actual_cost"], sub["budget"])
-                base_sum = float(pd.Series(base, index=sub.index).astype(float).fillna(0).sum())
-                prof_sum = float(sub["profit"].fillna(0).sum())
-                overall = float(prof_sum / base_sum) if base_sum > 0 else np.nan
-            rows_roi.append({"partner_department_id": pid, "overall_roi_ratio": overall})
-
-        roi_df = pd.DataFrame(rows_roi)
-        partners_full = agg_freq.merge(roi_df, on="partner_department_id", how="left")
+        # per-partner counts: sorted dense codes, then two bincounts
+        partner_codes, partner_ids = pd.factorize(pids_flat[keep], sort=True)
+        n_partners = len(partner_ids)
+        agg_freq = pd.DataFrame({
+            "partner_department_id": partner_ids,
+            "partner_department_name": [dep_name_map.get(pid, f"Department {pid}") for pid in partner_ids.tolist()],
+            "joint_projects": np.bincount(partner_codes, minlength=n_partners).astype(np.int64),
+            "joint_completed": np.bincount(partner_codes, weights=completed_flat[keep].astype(np.int32),
+                                           minlength=n_partners).astype(np.int64),
+        })
+
+        # For ROI by partner, take all projects where this partner was together with other department:
+        # one (project, partner) row per pair, mapped onto the same dense partner codes by array lookup
+        pair_ids = [ids if dep_id in ids else () for ids in joint_sets]
+        pair_lens = np.fromiter(map(len, pair_ids), dtype=np.int64, count=len(pair_ids))
+        pair_pids = np.fromiter(itertools.chain.from_iterable(pair_ids),
+                                dtype=np.int64, count=int(pair_lens.sum()))
+        pair_profit = np.repeat(profit, pair_lens)
+        pair_cost = np.repeat(cost_base, pair_lens)
+        keep = pair_pids != dep_id
+
+        # every ROI pair is also a joint-project pair, so each id already has a code
+        lo = int(partner_ids.min())
+        code_of = np.full(int(partner_ids.max()) - lo + 1, -1, dtype=np.int64)
+        code_of[partner_ids - lo] = np.arange(n_partners)
+        partners_full = agg_freq
+        partners_full["overall_roi_ratio"] = partner_roi(code_of[pair_pids[keep] - lo],
+                                                         pair_profit[keep], pair_cost[keep], n_partners)
         partners_full["overall_roi_pct"] = partners_full["overall_roi_ratio"] * 100.0
 
+        # ascending sort keys: descending frequency / ROI, NaN ROI last
+        freq_key = -partners_full["joint_projects"].to_numpy(dtype=np.float64)
+        roi_key = -np.nan_to_num(partners_full["overall_roi_ratio"].to_numpy(dtype=np.float64, na_value=np.nan),
+                                 nan=-np.inf)
+
         #TOP-5 by frequency
-        top_partners = (partners_full
-                        .sort_values(["joint_projects","overall_roi_ratio"], ascending=[False, False])
-                        .head(5)
-                        .reset_index(drop=True))
+        top_partners = partners_full.iloc[self._top_k((roi_key, freq_key), 5)].reset_index(drop=True)
 
         #TOP-5 by ROI
-        partners_by_roi = (partners_full
-                           .sort_values("overall_roi_ratio", ascending=False, na_position="last")
-                           .head(5)
-                           .reset_index(drop=True))
+        partners_by_roi = partners_full.iloc[self._top_k((roi_key,), 5)].reset_index(drop=True)
 
         result = {
             "title": HEAD_COLLAB,
@@ -212,18 +250,7 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
         @return str path to saved image
         """
         self._ensure_dir(out_dir)
-        df = self.projects_df()
-        part_counts = df["participating_departments"].apply(self._safe_participants_len)
-        solo = int((part_counts < int(Thresholds.JOINT_MIN_DEPTS)).sum())
-        joint = int((part_counts >= int(Thresholds.JOINT_MIN_DEPTS)).sum())
-
-        plt.figure()
-        plt.pie([solo, joint], labels=["Solo", "Joint"], autopct="%1.1f%%", startangle=90)
-        plt.title("Collaboration rate (solo vs joint)")
-        path = os.path.join(out_dir, "collaboration_rate_pie.png")
-        plt.savefig(path, dpi=130, bbox_inches="tight")
-        plt.close()
-        return path
+        return self._run_plot(self._collab_pie_job(out_dir))
 
     def plot_top_partners_bar(self, result: Dict[str, Any], out_dir: str = "plots") -> str:
         """
@@ -233,22 +260,7 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
         @return str path to saved image
         """
         self._ensure_dir(out_dir)
-        tp = result.get("top_partners")
-        if not isinstance(tp, pd.DataFrame) or tp.empty:
-            return os.path.join(out_dir, "top_partners_bar.png")
-
-        plt.figure()
-        x = tp["partner_department_name"]
-        y = tp["joint_projects"]
-        plt.bar(x, y)
-        plt.xticks(rotation=30, ha="right")
-        plt.ylabel("Joint projects")
-        plt.title("Top-5 partners by frequency")
-        path = os.path.join(out_dir, "top_partners_bar.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        return self._run_plot(self._top_partners_job(result, out_dir))
 
     def plot_partners_roi_bar(self, result: Dict[str, Any], out_dir: str = "plots") -> str:
         """
@@ -258,22 +270,7 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
         @return str path to saved image
         """
         self._ensure_dir(out_dir)
-        tbl = result.get("partners_by_roi")
-        if not isinstance(tbl, pd.DataFrame) or tbl.empty:
-            return os.path.join(out_dir, "partners_by_roi_bar.png")
-
-        plt.figure()
-        x = tbl["partner_department_name"]
-        y = tbl["overall_roi_ratio"]
-        plt.bar(x, y)
-        plt.xticks(rotation=30, ha="right")
-        plt.ylabel("Aggregate ROI (ratio)")
-        plt.title("Top-5 partners by ROI")
-        path = os.path.join(out_dir, "partners_by_roi_bar.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        return self._run_plot(self._partners_roi_job(result, out_dir))
 
     def plot_joint_projects_roi_hist(self, out_dir: str = "plots", bins: int = 10) -> str:
         """
@@ -283,45 +280,130 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
         @return str path to saved image
         """
         self._ensure_dir(out_dir)
-        prj = self.projects_df().copy()
-        part_counts = prj["participating_departments"].apply(self._safe_participants_len)
-        is_joint = part_counts >= int(Thresholds.JOINT_MIN_DEPTS)
-        df = prj.loc[is_joint].copy()
+        return self._run_plot(self._roi_hist_job(out_dir, bins))
+
+    def plot_all(self, result: Dict[str, Any], out_dir: str = "plots", bins: int = 10) -> List[str]:
+        """
+        @brief Render all four collaboration plots.
+        @param result  Dict returned from execute_analysis()
+        @param out_dir Output directory
+        @param bins    Number of bins for the ROI histogram
+        @return list of paths: pie, top partners, partners by ROI, ROI histogram
+        """
+        self._ensure_dir(out_dir)
+        return self._run_plots([
+            self._collab_pie_job(out_dir),
+            self._top_partners_job(result, out_dir),
+            self._partners_roi_job(result, out_dir),
+            self._roi_hist_job(out_dir, bins),
+        ])
+
+    # Plot jobs: (render function, path, *args); empty inputs get a titled placeholder
+    def _collab_pie_job(self, out_dir: str) -> Tuple:
+        is_joint = self._prepared().is_joint
+        joint = int(is_joint.sum())
+        solo = int(is_joint.size - joint)
+        path = os.path.join(out_dir, "collaboration_rate_pie.png")
+        if is_joint.size == 0:
+            return (render_empty, path, "Collaboration rate (no data)")
+        return (_render_collab_pie, path, solo, joint, self.PIE_FIGSIZE)
+
+    @staticmethod
+    def _top_partners_job(result: Dict[str, Any], out_dir: str) -> Tuple:
+        path = os.path.join(out_dir, "top_partners_bar.png")
+        tp = result.get("top_partners")
+        if not isinstance(tp, pd.DataFrame) or tp.empty:
+            return (render_empty, path, "Top-5 partners by frequency (no data)")
+        return (_render_partner_bars, path, tp["partner_department_name"].tolist(),
+                tp["joint_projects"].to_numpy(), "Joint projects", "Top-5 partners by frequency")
+
+    @staticmethod
+    def _partners_roi_job(result: Dict[str, Any], out_dir: str) -> Tuple:
+        path = os.path.join(out_dir, "partners_by_roi_bar.png")
+        tbl = result.get("partners_by_roi")
+        if not isinstance(tbl, pd.DataFrame) or tbl.empty:
+            return (render_empty, path, "Top-5 partners by ROI (no data)")
+        return (_render_partner_bars, path, tbl["partner_department_name"].tolist(),
+                tbl["overall_roi_ratio"].to_numpy(), "Aggregate ROI (ratio)", "Top-5 partners by ROI")
+
+    def _roi_hist_job(self, out_dir: str, bins: int) -> Tuple:
+        prep = self._prepared()
+        m = prep.is_joint
 
         # compute roi like in execute_analysis
-        df["budget"] = pd.to_numeric(df.get("budget"), errors="coerce")
-        df["actual_cost"] = pd.to_numeric(df.get("actual_cost"), errors="coerce")
-        df["profit"] = pd.to_numeric(df.get("profit"), errors="coerce")
-        df["roi_pct"] = pd.to_numeric(df.get("roi_pct"), errors="coerce")
-        roi = np.nan * np.ones(len(df))
-        has_explicit = df["roi_pct"].notna()
-        roi[has_explicit.values] = (df.loc[has_explicit, "roi_pct"] / 100.0).values
-        m_act = (~has_explicit) & df["actual_cost"].notna() & (df["actual_cost"] > 0) & df["profit"].notna()
-        roi[m_act.values] = (df.loc[m_act, "profit"] / df.loc[m_act, "actual_cost"]).values
-        m_bud = (~has_explicit) & (~m_act) & df["budget"].notna() & (df["budget"] > 0) & df["profit"].notna()
-        roi[m_bud.values] = (df.loc[m_bud, "profit"] / df.loc[m_bud, "budget"]).values
-        roi = pd.to_numeric(pd.Series(roi), errors="coerce").dropna()
-
-        plt.figure()
-        plt.hist(roi, bins=bins)
-        plt.xlabel("ROI (ratio)")
-        plt.ylabel("Projects")
-        plt.title("Joint projects - ROI distribution")
+        roi = self._roi_ratio(prep.budget[m], prep.actual_cost[m], prep.profit[m], prep.roi_pct[m])
+        roi = roi[~np.isnan(roi)]
         path = os.path.join(out_dir, "joint_projects_roi_hist.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        if roi.size == 0:
+            return (render_empty, path, "Joint projects - ROI distribution (no data)")
+        return (_render_roi_hist, path, roi, bins)
 
+    @staticmethod
+    def _top_k(keys: Tuple[np.ndarray, ...], k: int) -> np.ndarray:
+        """
+        @brief Positions of the k smallest rows, ordered like a stable np.lexsort(keys).
+        @param keys Sort keys as for np.lexsort (last key is primary, ascending)
+        @param k    Number of rows to return
+        @return np.ndarray of row positions
+        @note Only rows that can reach the top k by the primary key (found with np.partition) are sorted.
+        """
+        primary = keys[-1]
+        if primary.size > k:
+            kth = np.partition(primary, k - 1)[k - 1]
+            cand = np.flatnonzero(primary <= kth)
+        else:
+            cand = np.arange(primary.size)
+        order = np.lexsort(tuple(key[cand] for key in keys))
+        return cand[order[:k]]
 
     @staticmethod
-    def _safe_participants_len(value) -> int:
+    def _roi_ratio(budget: np.ndarray, actual: np.ndarray, profit: np.ndarray, pct: np.ndarray) -> np.ndarray:
         """
-        @brief Safe length getter for participating_departments.
-        @param value Raw field from JSON
-        @return int length
+        @brief Per-project ROI ratio: roi_pct/100, else profit/actual_cost, else profit/budget.
+        @param budget, actual, profit, pct float64 arrays (NaN for missing)
+        @return float64 array (NaN when no rule applies)
         """
-        return len(value) if isinstance(value, list) else 0
+        has_profit = ~np.isnan(profit)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.select(
+                [~np.isnan(pct), (actual > 0) & has_profit, (budget > 0) & has_profit],
+                [pct / 100.0, profit / actual, profit / budget],
+                default=np.nan,
+            )
+
+    def _prepared(self) -> PreparedProjects:
+        """
+        @brief Projects frame normalized once for execute_analysis and the plots.
+        @return PreparedProjects (cached until the shared projects frame changes)
+        """
+        cache = getattr(self, "_prepared_cache", None)
+        if cache is not None and cache[0] is self.projects_df_:
+            return cache[1]
+
+        df = self.projects_df_
+        missing = [c for c in ("participating_departments", "is_completed", "budget", "actual_cost",
+                               "profit", "roi_pct", "duration_days") if c not in df.columns]
+        if missing:
+            df = df.assign(**{c: np.nan for c in missing})
+
+        raw = df["participating_departments"].to_numpy()
+        ids_per_row = [tuple(self._safe_participants_ids(v)) for v in raw]
+        # joint = number of listed participants, including entries without a usable department_id
+        part_counts = np.fromiter((len(v) if isinstance(v, list) else 0 for v in raw),
+                                  dtype=np.int32, count=len(raw))
+
+        prep = PreparedProjects(
+            df=df,
+            is_joint=part_counts >= int(Thresholds.JOINT_MIN_DEPTS),
+            ids_per_row=ids_per_row,
+            id_sets=[frozenset(ids) for ids in ids_per_row],
+            budget=self._to_f64(df["budget"]),
+            actual_cost=self._to_f64(df["actual_cost"]),
+            profit=self._to_f64(df["profit"]),
+            roi_pct=self._to_f64(df["roi_pct"]),
+        )
+        self._prepared_cache = (self.projects_df_, prep)
+        return prep
 
     @staticmethod
     def _safe_participants_ids(value) -> List[int]:
@@ -344,17 +426,22 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
     def _department_name_map(self) -> Dict[int, str]:
         """
         @brief Build mapping department_id.
+        @note Built once per loaded dataset and memoized on the instance.
         """
+        cache = getattr(self, "_dep_name_map_cache", None)
+        if cache is not None and cache[0] is self.raw:
+            return cache[1]
+
         mapping: Dict[int, str] = {}
-        try:
-            for d in (self.raw.departments or []):
-                did = d.get("id")
-                name = d.get("name")
-                if did is not None and name:
-                    mapping[int(did)] = str(name)
-        except Exception:
-            pass
+        deps = pd.DataFrame(self.raw.departments or [])
+        if not deps.empty and "id" in deps.columns and "name" in deps.columns:
+            ids = pd.to_numeric(deps["id"], errors="coerce")
+            names = deps["name"]
+            ok = ids.notna() & names.notna() & names.astype(bool)
+            mapping = dict(zip(ids[ok].astype("int64").tolist(), names[ok].astype(str).tolist()))
         mapping.setdefault(self.department_id, f"Department {self.department_id}")
+
+        self._dep_name_map_cache = (self.raw, mapping)
         return mapping
 
     @staticmethod
@@ -363,5 +450,4 @@ class InterdepartmentalAnalyzer(BaseAnalyzer):
         @brief Ensure that output directory exists.
         @param path Directory path
         """
-        if path:
-            os.makedirs(path, exist_ok=True)
+        ensure_dir(path)
@@ -6,14 +6,49 @@
         the longest project (by duration_days).
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import os
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
-from analyzers.base_rnd_analyzer import BaseAnalyzer
+from analyzers.base_rnd_analyzer import BaseAnalyzer, new_axes, render_empty
 from config.messages import HEAD_PROJECTS, ReportMsg, LogMsg
 from config.enums import ProjectStatus
+from utilits.io import ensure_dir
+
+
+# Module-level renderers; each draws on the per-thread figure and returns the saved path
+def _render_duration_hist(path: str, durations: np.ndarray, bins: int) -> str:
+    """
+    @brief Draw and save the project duration histogram.
+    """
+    fig, ax = new_axes()
+    ax.hist(durations, bins=bins)
+    ax.set_xlabel("Duration, days")
+    ax.set_ylabel("Projects")
+    ax.set_title("Projects - Duration distribution")
+    return BaseAnalyzer._save(fig, path)
+
+
+def _render_status_pie(path: str, labels: List[str], counts: np.ndarray) -> str:
+    """
+    @brief Draw and save the project status pie.
+    """
+    fig, ax = new_axes()
+    ax.pie(counts, labels=labels, autopct="%1.0f%%", startangle=90)
+    ax.set_title("Projects - Status breakdown")
+    return BaseAnalyzer._save(fig, path)
+
+
+def _render_top_longest(path: str, names: List[str], days: np.ndarray) -> str:
+    """
+    @brief Draw and save horizontal bars for the longest projects (longest on top).
+    """
+    fig, ax = new_axes()
+    ax.barh(names[::-1], days[::-1])
+    ax.set_xlabel("Duration, days")
+    ax.set_title(f"Top {len(names)} longest projects")
+    return BaseAnalyzer._save(fig, path)
 
 
 class ProjectAnalyzer(BaseAnalyzer):
@@ -29,7 +64,7 @@ class ProjectAnalyzer(BaseAnalyzer):
         """
         self.logger.info(LogMsg.ANALYSIS_START.format("Project Analysis"))
 
-        df = self.projects_df()
+        df = self.projects_df(copy=False)
         if df is None or df.empty:
             self.logger.info("Projects DataFrame is empty - returning zeros")
             return {
@@ -41,30 +76,34 @@ class ProjectAnalyzer(BaseAnalyzer):
                 )
             }
 
-        for col in ("duration_days", "status", "start_date", "end_date"):
-            if col not in df.columns:
-                df[col] = None
+        missing = [c for c in ("duration_days", "status", "start_date", "end_date") if c not in df.columns]
+        if missing:
+            df = df.assign(**{c: None for c in missing})
 
         # Average duration (days)
         self.logger.info(LogMsg.METRIC_START.format("avg_duration_days"))
-        dur = pd.to_numeric(df["duration_days"], errors="coerce")
-        avg_duration = float(dur.mean()) if len(df) else 0.0
+        dur = self._to_f64(df["duration_days"])
+        n_dur = np.count_nonzero(~np.isnan(dur))
+        avg_duration = float(np.nansum(dur) / n_dur) if n_dur else float("nan")
         self.logger.info(LogMsg.METRIC_DONE.format("avg_duration_days", round(avg_duration, 1)))
 
         # Success rate (completed/total)
         self.logger.info(LogMsg.METRIC_START.format("success_rate_percent"))
-        status = df["status"].astype(str).str.lower()
-        completed_mask = status.eq(ProjectStatus.COMPLETED.value)
-        success_rate = float((completed_mask.mean() * 100.0) if len(df) else 0.0)
+        status = self._status_categorical(df["status"])
+        try:
+            completed_code = status.categories.get_loc(ProjectStatus.COMPLETED.value)
+        except KeyError:
+            completed_code = -2  # no completed projects; never matches a code
+        success_rate = float(((status.codes == completed_code).mean() * 100.0) if len(df) else 0.0)
         self.logger.info(LogMsg.METRIC_DONE.format("success_rate_percent", round(success_rate, 1)))
 
         # Longest project (by duration_days)
         self.logger.info(LogMsg.METRIC_START.format("longest_project"))
+        numeric = (df if df["duration_days"].dtype.kind in "fiu"
+                   else df.assign(duration_days=self._to_f64(df["duration_days"])))
         longest = (
-            df.assign(duration_days=pd.to_numeric(df["duration_days"], errors="coerce"))
-              .sort_values("duration_days", ascending=False)
+            numeric.nlargest(1, "duration_days")
               .loc[:, ["project_id", "name", "duration_days", "status", "start_date", "end_date"]]
-              .head(1)
         )
         self.logger.info(
             LogMsg.METRIC_DONE.format(
@@ -112,19 +151,7 @@ class ProjectAnalyzer(BaseAnalyzer):
         @return str path to PNG file
         """
         self._ensure_dir(out_dir)
-        df = self.projects_df()
-        durations = pd.to_numeric(df["duration_days"], errors="coerce").dropna()
-
-        plt.figure()
-        plt.hist(durations, bins=bins)
-        plt.xlabel("Duration, days")
-        plt.ylabel("Projects")
-        plt.title("Projects - Duration distribution")
-        path = os.path.join(out_dir, "projects_duration_hist.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        return self._run_plot(self._duration_hist_job(bins, out_dir))
 
     def plot_status_pie(self, result: Dict[str, Any], out_dir: str = "plots") -> str:
         """
@@ -134,19 +161,7 @@ class ProjectAnalyzer(BaseAnalyzer):
         @return str path to PNG file
         """
         self._ensure_dir(out_dir)
-        df = self.projects_df()
-        status_counts = (
-            df["status"].astype(str).str.lower().replace("", "unknown").value_counts().sort_index()
-        )
-
-        plt.figure()
-        plt.pie(status_counts.values, labels=status_counts.index, autopct="%1.0f%%", startangle=90)
-        plt.title("Projects - Status breakdown")
-        path = os.path.join(out_dir, "projects_status_pie.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+        return self._run_plot(self._status_pie_job(out_dir))
 
     def plot_top_longest(self, result: Dict[str, Any], k: int = 10, out_dir: str = "plots") -> str:
         """
@@ -157,25 +172,61 @@ class ProjectAnalyzer(BaseAnalyzer):
         @return str path to PNG file
         """
         self._ensure_dir(out_dir)
-        df = self.projects_df().assign(
-            duration_days=pd.to_numeric(self.projects_df()["duration_days"], errors="coerce")
-        )
-        top = (
-            df.dropna(subset=["duration_days"])
-              .sort_values("duration_days", ascending=False)
-              .head(k)[["name", "duration_days"]]
-        )
+        return self._run_plot(self._top_longest_job(k, out_dir))
 
-        plt.figure()
-        plt.barh(top["name"][::-1], top["duration_days"][::-1])
-        plt.xlabel("Duration, days")
-        plt.title(f"Top {len(top)} longest projects")
-        plt.tight_layout()
-        path = os.path.join(out_dir, "projects_top_longest.png")
-        plt.savefig(path, dpi=130)
-        plt.close()
-        return path
+    def plot_all(self, result: Dict[str, Any], bins: int = 10, k: int = 10, out_dir: str = "plots") -> List[str]:
+        """
+        @brief Render all three project plots.
+        @param result  Dict from execute_analysis()
+        @param bins    Number of bins for the duration histogram
+        @param k       Number of projects in the longest-projects chart
+        @param out_dir Output directory
+        @return list of paths: duration histogram, status pie, top longest
+        """
+        self._ensure_dir(out_dir)
+        return self._run_plots([
+            self._duration_hist_job(bins, out_dir),
+            self._status_pie_job(out_dir),
+            self._top_longest_job(k, out_dir),
+        ])
+
+    # Plot jobs: (render function, path, *args)
+    def _duration_hist_job(self, bins: int, out_dir: str) -> Tuple:
+        durations = self._to_f64(self.projects_df(copy=False)["duration_days"])
+        durations = durations[~np.isnan(durations)]
+        return (_render_duration_hist, os.path.join(out_dir, "projects_duration_hist.png"), durations, bins)
+
+    def _status_pie_job(self, out_dir: str) -> Tuple:
+        df = self.projects_df(copy=False)
+        status_counts = pd.Series(self._status_categorical(df["status"])).value_counts(sort=False)
+        status_counts = status_counts[status_counts > 0].sort_index()
+        path = os.path.join(out_dir, "projects_status_pie.png")
+        if status_counts.empty:
+            return (render_empty, path, "Projects - Status breakdown (no data)")
+        return (_render_status_pie, path, status_counts.index.astype(str).tolist(), status_counts.to_numpy())
+
+    def _top_longest_job(self, k: int, out_dir: str) -> Tuple:
+        df_raw = self.projects_df(copy=False)
+        df = (df_raw if df_raw["duration_days"].dtype.kind in "fiu"
+              else df_raw.assign(duration_days=self._to_f64(df_raw["duration_days"])))
+        top = df.nlargest(k, "duration_days")[["name", "duration_days"]]
+        return (_render_top_longest, os.path.join(out_dir, "projects_top_longest.png"),
+                top["name"].tolist(), top["duration_days"].to_numpy())
 
+    @staticmethod
+    def _status_categorical(status: pd.Series) -> pd.Categorical:
+        """
+        @brief Lower-cased project status as a Categorical ("" - "unknown", missing - "none").
+        @param status Raw status column (categorical or object)
+        @return pd.Categorical with lexically sorted categories
+        @note Lower-casing runs once per distinct label; rows are only re-coded.
+        """
+        if not isinstance(status.dtype, pd.CategoricalDtype):
+            status = status.astype("category")
+        labels = status.cat.categories.astype(str).str.lower().str.replace(r"^$", "unknown", regex=True)
+        # Missing values carry code -1, which picks the trailing "none" label
+        recode, uniques = pd.factorize(np.append(labels.to_numpy(dtype=object), "none"), sort=True)
+        return pd.Categorical.from_codes(recode[status.cat.codes.to_numpy()], categories=uniques)
 
     @staticmethod
     def _ensure_dir(path: str) -> None:
@@ -183,5 +234,4 @@ class ProjectAnalyzer(BaseAnalyzer):
         @brief Output directory exists.
         @param path Directory path to create if missing
         """
-        if path:
-            os.makedirs(path, exist_ok=True)
+        ensure_dir(path)
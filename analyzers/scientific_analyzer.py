@@ -6,14 +6,56 @@
         top performers: employees with a scientific degree and performance_score > threshold.
 """
 
-from typing import Dict, Any, List
+import io
+from typing import Dict, Any, List, Tuple
 import os
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
-from analyzers.base_rnd_analyzer import BaseAnalyzer
+from analyzers.base_rnd_analyzer import BaseAnalyzer, new_axes, render_empty
 from config.messages import HEAD_SCIENCE, ReportMsg, LogMsg
-from config.enums import DEGREE_ORDER, Thresholds
+from config.enums import DEGREE_ORDER, DEGREE_ORDER_DTYPE, SCIENCE_DEGREES, Thresholds
+from utilits.io import ensure_dir
+
+# @brief One top-performer line of the report: id, name, position, degree, score, certificates
+TOP_PERFORMER_ROW = "    * [{}] {} - {}; degree={}; score={}; certs={}\n"
+
+
+# @brief Output resolution of the scientific plots (matplotlib's default figure dpi)
+PLOT_DPI = 100
+
+
+# Module-level renderers (run on the plot thread pool); each returns the saved path
+def _render_degree_bars(path: str, counts: pd.Series) -> str:
+    """
+    @brief Draw and save the degree distribution bar plot.
+    """
+    fig, ax = new_axes()
+    counts.plot(kind="bar", ax=ax)
+    ax.set_title("Degree distribution")
+    ax.set_xlabel("degree")
+    ax.set_ylabel("count")
+    for label in ax.get_xticklabels():
+        label.set_rotation(25)
+        label.set_horizontalalignment("right")
+    return BaseAnalyzer._save(fig, path, dpi=PLOT_DPI)
+
+
+def _render_pie(path: str, labels: List[str], values: List[int], title: str) -> str:
+    """
+    @brief Draw and save a clockwise pie chart with percentage labels.
+    """
+    fig, ax = new_axes(figsize=(6, 6))
+    ax.pie(
+        values,
+        labels=labels,
+        autopct="%1.1f%%",
+        startangle=90,
+        counterclock=False
+    )
+    ax.axis("equal")  # equal aspect ratio ensures circular pie
+    ax.set_title(title)
+    return BaseAnalyzer._save(fig, path, dpi=PLOT_DPI)
 
 
 class ScientificAnalyzer(BaseAnalyzer):
@@ -22,14 +64,22 @@ class ScientificAnalyzer(BaseAnalyzer):
     @brief Computes metrics on top.
     """
 
+    # @brief Top performers kept in the result (the report shows this many; the total is stored separately)
+    TOP_SHOWN: int = 10
+
     def execute_analysis(self) -> Dict[str, Any]:
         """
         @brief Run the scientific potential analysis pipeline.
         @return dict 
+        @note The result is cached until the shared employees frame changes - do not mutate it.
         """
+        cache = getattr(self, "_result_cache", None)
+        if cache is not None and cache[0] is self.employees_df_:
+            return cache[1]
+
         self.logger.info(LogMsg.ANALYSIS_START.format("Scientific Potential"))
 
-        df = self.employees_df()
+        df = self.employees_df(copy=False)
         if df is None or df.empty:
             self.logger.info("Employees DataFrame is empty - returning zeros")
             result = {
@@ -37,44 +87,65 @@ class ScientificAnalyzer(BaseAnalyzer):
                 "avg_certificates_per_employee": 0.0,
                 "top_performers": pd.DataFrame(
                     columns=["employee_id", "full_name", "position", "degree", "performance_score", "certifications"]
-                )
+                ),
+                "top_performers_total": 0,
             }
             self.logger.info(LogMsg.ANALYSIS_COMPLETE.format("Scientific Potential"))
             return result
 
-        for col in ("degree", "certifications", "performance_score"):
-            if col not in df.columns:
-                df[col] = None
+        missing = [c for c in ("degree", "certifications", "performance_score") if c not in df.columns]
+        if missing:
+            df = df.assign(**{c: None for c in missing})
+        if "_certs_num" not in df.columns or "_perf_num" not in df.columns:
+            df = df.assign(
+                _certs_num=pd.to_numeric(df["certifications"], errors="coerce").fillna(0).astype(np.float32),
+                _perf_num=pd.to_numeric(df["performance_score"], errors="coerce"),
+            )
 
         # Degree distribution in canonical order
         self.logger.info(LogMsg.METRIC_START.format("degree_distribution"))
-        dist = df["degree"].value_counts(dropna=False).reindex(DEGREE_ORDER, fill_value=0).astype(int)
+        degree = df["degree"]
+        if not isinstance(degree.dtype, pd.CategoricalDtype):
+            degree = degree.astype("category")
+        # counts come out in category order, so DEGREE_ORDER categories need no reindex
+        dist = degree.astype(DEGREE_ORDER_DTYPE).value_counts(sort=False)
+        dist = dist.set_axis(dist.index.astype(object))
         self.logger.info(LogMsg.METRIC_DONE.format("degree_distribution", int(dist.sum())))
 
         # Average certificates per employee
         self.logger.info(LogMsg.METRIC_START.format("avg_certificates_per_employee"))
-        avg_certs = float(pd.to_numeric(df["certifications"], errors="coerce").fillna(0).mean())
+        avg_certs = self.safe_mean(df["_certs_num"])
         self.logger.info(LogMsg.METRIC_DONE.format("avg_certificates_per_employee", round(avg_certs, 2)))
 
         # Top performers: degree = dsc/phd and performance_score > threshold
         self.logger.info(LogMsg.METRIC_START.format("top_performers"))
         perf_thr = Thresholds.PERF_TOP
-        valid_science = {"phd", "dsc"}
-        mask_has_degree = df["degree"].astype(str).str.lower().isin(valid_science)
-        mask_perf = pd.to_numeric(df["performance_score"], errors="coerce") > perf_thr
+        # degree is the canonical lower-case categorical from BaseAnalyzer - isin matches on its codes
+        mask_has_degree = df["degree"].isin(SCIENCE_DEGREES)
+        mask_perf = df["_perf_num"] > perf_thr
+        subset = df.loc[mask_has_degree & mask_perf, ["employee_id", "full_name", "position",
+                                                      "degree", "performance_score", "certifications"]]
+        n_top = len(subset)
+        k = self.TOP_SHOWN
+        if n_top > k:
+            # only rows scoring at least the k-th best score can reach the shown list
+            scores = subset["performance_score"].to_numpy(dtype=np.float64)
+            kth = -np.partition(-scores, k - 1)[k - 1]
+            subset = subset.loc[scores >= kth]
         top = (
-            df.loc[mask_has_degree & mask_perf, ["employee_id", "full_name", "position",
-                                                 "degree", "performance_score", "certifications"]]
-              .sort_values(["performance_score", "degree"], ascending=[False, True])
-              .reset_index(drop=True)
+            subset.sort_values(["performance_score", "degree"], ascending=[False, True])
+                  .head(k)
+                  .reset_index(drop=True)
         )
-        self.logger.info(LogMsg.METRIC_DONE.format("top_performers", len(top)))
+        self.logger.info(LogMsg.METRIC_DONE.format("top_performers", n_top))
 
         result = {
             "degree_distribution": dist,
             "avg_certificates_per_employee": round(avg_certs, 2),
-            "top_performers": top
+            "top_performers": top,
+            "top_performers_total": n_top,
         }
+        self._result_cache = (self.employees_df_, result)
         self.logger.info(LogMsg.ANALYSIS_COMPLETE.format("Scientific Potential"))
         return result
 
@@ -84,36 +155,36 @@ class ScientificAnalyzer(BaseAnalyzer):
         @param result Output of execute_analysis()
         @return str formatted section ready for console
         """
-        lines: List[str] = []
+        buf = io.StringIO()
+        out = buf.write
 
         # Degree distribution
-        lines.append(ReportMsg.DEGREE_HEADER + ":")
+        out(ReportMsg.DEGREE_HEADER + ":\n")
         dist = result["degree_distribution"]
         if isinstance(dist, pd.Series) and not dist.empty:
             for deg in dist.index:
-                lines.append(f"  - {deg}: {int(dist.loc[deg])}")
+                out(f"  - {deg}: {int(dist.loc[deg])}\n")
         else:
-            lines.append("  - no data")
+            out("  - no data\n")
 
         # Average certificates
-        lines.append(ReportMsg.AVG_CERTS.format(result["avg_certificates_per_employee"]))
+        out(ReportMsg.AVG_CERTS.format(result["avg_certificates_per_employee"]) + "\n")
 
         # Top performers
         tp = result["top_performers"]
         if isinstance(tp, pd.DataFrame) and not tp.empty:
-            lines.append(ReportMsg.TOP_PERFORMERS.format(len(tp)))
-            head = tp.head(10).copy()
-            for _, r in head.iterrows():
-                lines.append(
-                    f"    * [{r['employee_id']}] {r['full_name']} - {r['position']}; "
-                    f"degree={r['degree']}; score={r['performance_score']}; certs={r['certifications']}"
-                )
-            if len(tp) > 10:
-                lines.append(f"    ... and {len(tp) - 10} more")
+            n_top = int(result.get("top_performers_total", len(tp)))
+            out(ReportMsg.TOP_PERFORMERS.format(n_top) + "\n")
+            head = tp.head(10)[["employee_id", "full_name", "position",
+                                "degree", "performance_score", "certifications"]]
+            for row in head.itertuples(index=False, name=None):
+                out(TOP_PERFORMER_ROW.format(*row))
+            if n_top > 10:
+                out(f"    ... and {n_top - 10} more\n")
         else:
-            lines.append(ReportMsg.TOP_PERFORMERS.format(0))
+            out(ReportMsg.TOP_PERFORMERS.format(0) + "\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]  # no trailing newline
 
     #Plotting API 
     def _ensure_outdir(self, out_dir: str) -> str:
@@ -123,7 +194,7 @@ class ScientificAnalyzer(BaseAnalyzer):
         @return str normalized output path
         @throws OSError if folder cannot be created
         """
-        os.makedirs(out_dir, exist_ok=True)
+        ensure_dir(out_dir)
         return out_dir
 
     def plot_degree_distribution(self, result: Dict[str, Any], out_dir: str = "plots") -> str:
@@ -134,27 +205,8 @@ class ScientificAnalyzer(BaseAnalyzer):
         @return str path to saved PNG
         """
         self._ensure_outdir(out_dir)
-        series = result.get("degree_distribution")
-        path = os.path.join(out_dir, "degree_distribution.png")
+        return self._run_plot(self._degree_bars_job(result, out_dir))
 
-        if not isinstance(series, pd.Series) or series.empty:
-            fig = plt.figure()
-            plt.title("Degree distribution (no data)")
-            plt.savefig(path, bbox_inches="tight")
-            plt.close(fig)
-            return path
-
-        fig = plt.figure()
-        series.loc[DEGREE_ORDER].astype(int).plot(kind="bar")
-        plt.title("Degree distribution")
-        plt.xlabel("degree")
-        plt.ylabel("count")
-        plt.xticks(rotation=25, ha="right")
-        plt.tight_layout()
-        plt.savefig(path, bbox_inches="tight")
-        plt.close(fig)
-        return path
-    
     def plot_degree_pie(self, result: Dict[str, Any], out_dir: str = "plots") -> str:
         """
         @brief Save pie chart showing degree distribution across employees.
@@ -163,37 +215,8 @@ class ScientificAnalyzer(BaseAnalyzer):
         @return str path to saved PNG
         @note Uses canonical degree order for visual consistency.
         """
-
-        # ensure directory
         self._ensure_outdir(out_dir)
-        path = os.path.join(out_dir, "degree_distribution_pie.png")
-
-        # fetch data
-        series = result.get("degree_distribution")
-        if not isinstance(series, pd.Series) or series.empty:
-            fig = plt.figure()
-            plt.title("Degree distribution (no data)")
-            plt.savefig(path, bbox_inches="tight")
-            plt.close(fig)
-            return path
-
-        series = series.reindex(DEGREE_ORDER, fill_value=0)
-        data = series[series > 0]
-
-        fig, ax = plt.subplots(figsize=(6, 6))
-        wedges, texts, autotexts = ax.pie(
-            data.values,
-            labels=data.index,
-            autopct="%1.1f%%",
-            startangle=90,
-            counterclock=False
-        )
-        ax.axis("equal")  # equal aspect ratio ensures circular pie
-        plt.title("Degree distribution (canonical order)")
-        plt.tight_layout()
-        plt.savefig(path, bbox_inches="tight")
-        plt.close(fig)
-        return path
+        return self._run_plot(self._degree_pie_job(result, out_dir))
 
     def plot_certificates_pie(self, out_dir: str = "plots") -> str:
         """
@@ -202,39 +225,53 @@ class ScientificAnalyzer(BaseAnalyzer):
         @return str path to saved PNG
         @note Certificates are grouped into bins.
         """
+        self._ensure_outdir(out_dir)
+        return self._run_plot(self._certs_pie_job(out_dir))
 
+    def plot_all(self, result: Dict[str, Any], out_dir: str = "plots") -> List[str]:
+        """
+        @brief Render all scientific plots on the plot thread pool and wait for them.
+        @param result  Dict from execute_analysis()
+        @param out_dir Output directory
+        @return [degree bars, degree pie, certificates pie] paths
+        """
         self._ensure_outdir(out_dir)
+        return self._run_plots([
+            self._degree_bars_job(result, out_dir),
+            self._degree_pie_job(result, out_dir),
+            self._certs_pie_job(out_dir),
+        ])
+
+    # Plot jobs: (render function, path, *args) - data is extracted here, drawing happens on the pool
+    def _degree_bars_job(self, result: Dict[str, Any], out_dir: str) -> Tuple:
+        path = os.path.join(out_dir, "degree_distribution.png")
+        series = result.get("degree_distribution")
+        if not isinstance(series, pd.Series) or series.empty:
+            return (render_empty, path, "Degree distribution (no data)", PLOT_DPI)
+        return (_render_degree_bars, path, series.loc[DEGREE_ORDER].astype(int))
+
+    def _degree_pie_job(self, result: Dict[str, Any], out_dir: str) -> Tuple:
+        path = os.path.join(out_dir, "degree_distribution_pie.png")
+        series = result.get("degree_distribution")
+        if not isinstance(series, pd.Series) or series.empty:
+            return (render_empty, path, "Degree distribution (no data)", PLOT_DPI)
+
+        series = series.reindex(DEGREE_ORDER, fill_value=0)
+        data = series[series > 0]
+        return (_render_pie, path, data.index.tolist(), data.to_numpy().tolist(),
+                "Degree distribution (canonical order)")
+
+    def _certs_pie_job(self, out_dir: str) -> Tuple:
         path = os.path.join(out_dir, "certificates_pie.png")
+        df = self.employees_df(copy=False)
+        if df is None or df.empty or "_certs_num" not in df.columns:
+            return (render_empty, path, "Certificates distribution (no data)", PLOT_DPI)
 
-        df = self.employees_df()
-        if df is None or df.empty or "certifications" not in df.columns:
-            fig = plt.figure()
-            plt.title("Certificates distribution (no data)")
-            plt.savefig(path, bbox_inches="tight")
-            plt.close(fig)
-            return path
-
-        vals = pd.to_numeric(df["certifications"], errors="coerce").fillna(0)
-        bins = {
-            "0": (vals == 0).sum(),
-            "1–2": ((vals >= 1) & (vals <= 2)).sum(),
-            "3–4": ((vals >= 3) & (vals <= 4)).sum(),
-            "5+": (vals >= 5).sum(),
-        }
+        vals = df["_certs_num"].to_numpy(dtype=np.float64)
+        # one pass: bin 0 = negative (not shown), then 0 / 1–2 / 3–4 / 5+
+        counts = np.bincount(np.digitize(vals, [0, 1, 3, 5]), minlength=5)[1:].tolist()
+        bins = dict(zip(["0", "1–2", "3–4", "5+"], counts))
 
         data = {k: v for k, v in bins.items() if v > 0}
-
-        fig, ax = plt.subplots(figsize=(6, 6))
-        wedges, texts, autotexts = ax.pie(
-            data.values(),
-            labels=data.keys(),
-            autopct="%1.1f%%",
-            startangle=90,
-            counterclock=False
-        )
-        ax.axis("equal")
-        plt.title("Certificates per employee (grouped)")
-        plt.tight_layout()
-        plt.savefig(path, bbox_inches="tight")
-        plt.close(fig)
-        return path
+        return (_render_pie, path, list(data.keys()), list(data.values()),
+                "Certificates per employee (grouped)")
@@ -3,13 +3,20 @@
 @brief Calculation of the optimal budget = (sum of department 26 allocations in ACTIVE + PLANNING projects) + 500_000.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional
+import io
 import numpy as np
 import pandas as pd
 
 from analyzers.base_rnd_analyzer import BaseAnalyzer
+from analyzers._kernels import dept_kpis
 from config.messages import HEAD_STRATEGY, LogMsg
-from config.enums import Thresholds
+from config.enums import Thresholds, PLANNING_STATUSES, ACTIVE_STATUSES, COMPLETED_STATUSES
+
+
+# @brief Project columns carried into the department-26 frame
+USED_COLS = ["project_id", "budget", "actual_cost", "profit", "roi_pct", "duration_days",
+             "status", "is_completed", "completion_percentage"]
 
 
 class StrategyAnalyzer(BaseAnalyzer):
@@ -23,11 +30,15 @@ class StrategyAnalyzer(BaseAnalyzer):
         @brief Run the strategy pipeline and compute optimal budget + KPIs.
         @return Dict with title, success criteria, optimal budget breakdown, current budget,
                 gap, KPI summary and monitoring metric list.
+        @note The result is cached until the shared projects frame changes - do not mutate it.
         """
+        cache = getattr(self, "_result_cache", None)
+        if cache is not None and cache[0] is self.projects_df_:
+            return cache[1]
+
         self.logger.info(LogMsg.ANALYSIS_START.format("Development Strategy - dept=26 (allocation-based, simplified)"))
 
-        prj_all = self.projects_df()
-        df = self._projects_with_dept26_alloc(prj_all)  # all projects where dept 26 participates
+        df = self._dept26_projects()  # all projects where dept 26 participates
 
         current_budget = self._department_budget(self.department_id)
 
@@ -70,6 +81,7 @@ class StrategyAnalyzer(BaseAnalyzer):
             "monitoring_metrics": self._monitoring_metric_list(),
         }
 
+        self._result_cache = (self.projects_df_, result)
         self.logger.info(LogMsg.ANALYSIS_COMPLETE.format("Development Strategy - dept=26 (allocation-based, simplified)"))
         return result
 
@@ -79,47 +91,59 @@ class StrategyAnalyzer(BaseAnalyzer):
         @param result Output of execute_analysis()
         @return Formatted multiline string
         """
-        lines: List[str] = []
+        buf = io.StringIO()
+        out = buf.write
 
         bk = result.get("optimal_budget_breakdown", {})
         cb = result.get("current_budget_rub")
         gap = result.get("budget_gap_rub")
 
-        lines.append("Optimal Budget for Department 26:")
-        lines.append(f"  * planning:          {bk.get('planning', 0.0):,.0f}")
-        lines.append(f"  * active:            {bk.get('active', 0.0):,.0f}")
-        lines.append(f"  * completed:         {bk.get('completed', 0.0):,.0f}")
-        lines.append(f"  * min (planning+active):     {bk.get('min', 0.0):,.0f}")
-        lines.append(f"  * reserve (fixed):           {bk.get('reserve_fixed', 0.0):,.0f}")
-        lines.append(f"  * final (min + reserve):     {bk.get('final', 0.0):,.0f}")
-        lines.append(f"  * all (planning+active+completed): {bk.get('all', 0.0):,.0f}")
+        out("Optimal Budget for Department 26:\n")
+        out(f"  * planning:          {bk.get('planning', 0.0):,.0f}\n")
+        out(f"  * active:            {bk.get('active', 0.0):,.0f}\n")
+        out(f"  * completed:         {bk.get('completed', 0.0):,.0f}\n")
+        out(f"  * min (planning+active):     {bk.get('min', 0.0):,.0f}\n")
+        out(f"  * reserve (fixed):           {bk.get('reserve_fixed', 0.0):,.0f}\n")
+        out(f"  * final (min + reserve):     {bk.get('final', 0.0):,.0f}\n")
+        out(f"  * all (planning+active+completed): {bk.get('all', 0.0):,.0f}\n")
 
         if cb is not None:
-            lines.append(f"\nCurrent budget of department 26:        {cb:,.0f}")
+            out(f"\nCurrent budget of department 26:        {cb:,.0f}\n")
         if gap is not None:
             sign = "+" if gap >= 0 else "-"
-            lines.append(f"Gap (final - current):                 {sign}{abs(gap):,.0f}")
+            out(f"Gap (final - current):                 {sign}{abs(gap):,.0f}\n")
 
-        lines.append("\nSuccess criteria:")
+        out("\nSuccess criteria:\n")
         for i, c in enumerate(result.get("success_criteria", []), 1):
-            lines.append(f"  {i}. {c}")
+            out(f"  {i}. {c}\n")
 
         k = result.get("kpi_summary", {})
         if k:
-            lines.append("\nDepartment 26 KPIs (by participation share):")
-            lines.append(f"  * Projects with 26:                    {k.get('projects_total', 0)}")
-            lines.append(f"  * Aggregate ROI:                       {k.get('roi_agg_26', 0.0):.3f}")
-            lines.append(f"  * Average ROI:                         {k.get('roi_avg_26', 0.0):.3f}")
-            lines.append(f"  * Success rate (completed), %:         {k.get('success_rate_pct', 0.0):.1f}%")
+            out("\nDepartment 26 KPIs (by participation share):\n")
+            out(f"  * Projects with 26:                    {k.get('projects_total', 0)}\n")
+            out(f"  * Aggregate ROI:                       {k.get('roi_agg_26', 0.0):.3f}\n")
+            out(f"  * Average ROI:                         {k.get('roi_avg_26', 0.0):.3f}\n")
+            out(f"  * Success rate (completed), %:         {k.get('success_rate_pct', 0.0):.1f}%\n")
             pb = k.get("payback_median_days_26")
-            lines.append(f"  * Median payback (days):               {pb if pb is not None else '-'}")
-            lines.append(f"  * Budget utilization (avg), %:         {k.get('utilization_avg_pct_26', 0.0):.1f}%")
+            out(f"  * Median payback (days):               {pb if pb is not None else '-'}\n")
+            out(f"  * Budget utilization (avg), %:         {k.get('utilization_avg_pct_26', 0.0):.1f}%\n")
 
-        lines.append("\nMonitoring metric system:")
+        out("\nMonitoring metric system:\n")
         for i, m in enumerate(result.get("monitoring_metrics", []), 1):
-            lines.append(f"  {i}. {m}")
+            out(f"  {i}. {m}\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]  # no trailing newline
+
+    def _dept26_projects(self) -> pd.DataFrame:
+        """
+        @brief Projects with department 26 allocations, built once per shared projects frame.
+        @return pd.DataFrame (cached on the instance - do not mutate)
+        """
+        cache = getattr(self, "_prj_dept26_cache", None)
+        if cache is None or cache[0] is not self.projects_df_:
+            cache = (self.projects_df_, self._projects_with_dept26_alloc(self.projects_df_))
+            self._prj_dept26_cache = cache
+        return cache[1]
 
     def _projects_with_dept26_alloc(self, prj: pd.DataFrame) -> pd.DataFrame:
         """
@@ -130,40 +154,26 @@ class StrategyAnalyzer(BaseAnalyzer):
         if prj is None or prj.empty:
             return pd.DataFrame()
 
-        df = prj.copy()
-
-        # Extract allocations for 26 and total
-        def allocs_26_and_total(lst) -> Tuple[float, float]:
-            """
-            @brief Parse participating_departments list to get both dept26 and total allocations.
-            @param lst Raw list of participants
-            @return (dept26_alloc, total_alloc) or (NaN, NaN)
-            """
-            if not isinstance(lst, list):
-                return (np.nan, np.nan)
-            my, total, has_my = 0.0, 0.0, False
-            for it in lst:
-                if not isinstance(it, dict):
-                    continue
-                try:
-                    alloc = float(it.get("budget_allocation") or 0.0)
-                except Exception:
-                    alloc = 0.0
-                total += alloc
-                try:
-                    if int(it.get("department_id")) == 26:
-                        my += alloc
-                        has_my = True
-                except Exception:
-                    pass
-            return (my if has_my and my > 0 else np.nan, total if total > 0 else np.nan)
-
-        df[["dept26_alloc", "total_alloc"]] = df["participating_departments"].apply(
-            lambda x: pd.Series(allocs_26_and_total(x))
-        )
-        has_26 = df["dept26_alloc"].notna()
-
-        out = df.loc[has_26].copy()
+        # Extract allocations for 26 and total: one flat row per participant dict,
+        # numeric coercion on whole columns, per-project sums by bincount
+        raw = prj["participating_departments"].to_numpy()
+        parts = [(i, it.get("budget_allocation"), it.get("department_id"))
+                 for i, lst in enumerate(raw) if isinstance(lst, list)
+                 for it in lst if isinstance(it, dict)]
+        rows, alloc_raw, dep_raw = zip(*parts) if parts else ((), (), ())
+        row = np.asarray(rows, dtype=np.int64)
+        alloc = pd.to_numeric(pd.Series(alloc_raw, dtype=object),
+                              errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+        dep = pd.to_numeric(pd.Series(dep_raw, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+
+        total = np.bincount(row, weights=alloc, minlength=len(raw))
+        my = np.bincount(row, weights=np.where(np.trunc(dep) == 26, alloc, 0.0), minlength=len(raw))
+        has_26 = my > 0
+
+        # Only the selected rows of the columns used downstream are copied
+        cols = [c for c in USED_COLS if c in prj.columns]
+        out = prj.loc[has_26, cols].assign(dept26_alloc=my[has_26],
+                                           total_alloc=np.where(total > 0, total, np.nan)[has_26])
 
         # Normalize numeric fields
         for col in ["budget", "actual_cost", "profit", "roi_pct", "duration_days",
@@ -173,12 +183,16 @@ class StrategyAnalyzer(BaseAnalyzer):
         # Participation share
         out["share26"] = np.where(out["total_alloc"] > 0, out["dept26_alloc"] / out["total_alloc"], np.nan)
 
-        # Completion normalization (any indicator works)
-        out["is_completed"] = (
-            out.get("is_completed", False).fillna(False).astype(bool)
-            | out.get("status", "").astype(str).str.lower().eq("completed")
-            | (pd.to_numeric(out.get("completion_percentage", 0), errors="coerce") >= 100)
-        )
+        # Completion normalization (any indicator works), OR-ed into one buffer
+        n = len(out)
+        flag = (out["is_completed"].fillna(False).to_numpy(dtype=bool)
+                if "is_completed" in out.columns else np.zeros(n, dtype=bool))
+        done_pct = ((pd.to_numeric(out["completion_percentage"], errors="coerce") >= 100).to_numpy()
+                    if "completion_percentage" in out.columns else np.zeros(n, dtype=bool))
+        is_completed = np.empty(n, dtype=bool)
+        np.logical_or.reduce([flag, self._status_mask(out["status"], COMPLETED_STATUSES), done_pct],
+                             out=is_completed)
+        out["is_completed"] = is_completed
 
         # Profit portion of 26
         out["profit26"] = out["profit"] * out["share26"]
@@ -196,21 +210,20 @@ class StrategyAnalyzer(BaseAnalyzer):
         if df is None or df.empty:
             return res
 
-        d = df.copy()
-        d["dept26_alloc"] = pd.to_numeric(d["dept26_alloc"], errors="coerce")
+        alloc = pd.to_numeric(df["dept26_alloc"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
 
-        # Completion and status masks
-        is_completed = d["is_completed"]
-        status_l = d.get("status", "").astype(str).str.lower()
-        planning_set = {"planning", "planned", "plan", "scheduled", "in_planning"}
-        active_set   = {"active", "in_progress", "ongoing", "working", "execution", "running"}
+        # Completion and status masks (status matched on categorical codes)
+        is_completed = df["is_completed"].to_numpy(dtype=bool)
+        is_planning = self._status_mask(df["status"], PLANNING_STATUSES) & ~is_completed
+        is_active   = self._status_mask(df["status"], ACTIVE_STATUSES) & ~is_completed
 
-        is_planning = status_l.isin(planning_set) & (~is_completed)
-        is_active   = status_l.isin(active_set) & (~is_completed)
+        def alloc_sum(mask: np.ndarray) -> float:
+            picked = alloc[mask]
+            return float(picked[~np.isnan(picked)].sum())
 
-        res["completed"] = float(d.loc[is_completed, "dept26_alloc"].dropna().sum())
-        res["active"]    = float(d.loc[is_active,    "dept26_alloc"].dropna().sum())
-        res["planning"]  = float(d.loc[is_planning,  "dept26_alloc"].dropna().sum())
+        res["completed"] = alloc_sum(is_completed)
+        res["active"]    = alloc_sum(is_active)
+        res["planning"]  = alloc_sum(is_planning)
         res["all"]       = res["completed"] + res["active"] + res["planning"]
         return res
 
@@ -230,30 +243,22 @@ class StrategyAnalyzer(BaseAnalyzer):
                 "utilization_avg_pct_26": 0.0,
             }
 
-        # ROI for 26 
-        roi26 = pd.Series(np.nan, index=df.index)
-        mask = (df["dept26_alloc"] > 0) & df["profit26"].notna()
-        roi26.loc[mask] = df.loc[mask, "profit26"] / df.loc[mask, "dept26_alloc"]
-        roi_avg_26 = float(roi26.dropna().mean()) if roi26.notna().any() else 0.0
+        def col(name: str) -> np.ndarray:
+            return df[name].to_numpy(dtype=np.float64, na_value=np.nan)
 
-        cost_sum_26 = float(df["dept26_alloc"].fillna(0).sum())
-        profit_sum_26 = float(df["profit26"].fillna(0).sum())
+        # ROI, payback and utilization for 26 in one pass over the rows
+        payback_26 = np.empty(len(df))
+        roi_sum, roi_n, util_sum, util_n, cost_sum_26, profit_sum_26 = dept_kpis(
+            col("dept26_alloc"), col("profit26"), col("duration_days"),
+            col("actual_cost"), col("budget"), col("share26"), payback_26,
+        )
+        roi_avg_26 = roi_sum / roi_n if roi_n else 0.0
         roi_agg_26 = float(profit_sum_26 / cost_sum_26) if cost_sum_26 > 0 else 0.0
 
         success_rate = float(df["is_completed"].mean() * 100.0) if len(df) else 0.0
 
-        daily_profit_26 = df["profit26"] / df["duration_days"].replace(0, np.nan)
-        payback_26 = np.where(
-            (df["dept26_alloc"] > 0) & (daily_profit_26.notna()) & (daily_profit_26 > 0),
-            df["dept26_alloc"] / daily_profit_26,
-            np.nan,
-        )
-        payback_med_26 = float(pd.Series(payback_26).dropna().median()) if np.isfinite(payback_26).any() else None
-
-        actual26 = np.where(df["actual_cost"].notna(), df["actual_cost"] * df["share26"], np.nan)
-        plan26 = df["budget"] * df["share26"]
-        util = np.where((~np.isnan(actual26)) & (plan26 > 0), (actual26 / plan26) * 100.0, np.nan)
-        util_avg = float(pd.Series(util).dropna().mean()) if np.isfinite(util).any() else 0.0
+        payback_med_26 = float(np.nanmedian(payback_26)) if np.isfinite(payback_26).any() else None
+        util_avg = util_sum / util_n if util_n else 0.0
 
         return {
             "projects_total": int(len(df)),
@@ -264,6 +269,20 @@ class StrategyAnalyzer(BaseAnalyzer):
             "utilization_avg_pct_26": round(util_avg, 1),
         }
 
+    @staticmethod
+    def _status_mask(status: pd.Series, labels) -> np.ndarray:
+        """
+        @brief Rows whose lower-cased status is one of labels.
+        @param status Status column (categorical or object)
+        @param labels Set of lower-case status names
+        @return np.ndarray bool aligned with status
+        @note Lower-casing runs once per category; rows are matched by code (missing - False).
+        """
+        if not isinstance(status.dtype, pd.CategoricalDtype):
+            status = status.astype("category")
+        hit = status.cat.categories.astype(str).str.lower().isin(labels)
+        return np.append(hit, False)[status.cat.codes.to_numpy()]
+
     def _department_budget(self, department_id: int) -> Optional[float]:
         """
         @brief Read current budget of a department.
@@ -271,13 +290,34 @@ class StrategyAnalyzer(BaseAnalyzer):
         @return Budget as float or None if missing
         """
         try:
+            return self._budget_by_dept().get(int(department_id))
+        except (TypeError, ValueError):
+            return None
+
+    def _budget_by_dept(self) -> Dict[int, Optional[float]]:
+        """
+        @brief Department id -> budget map, built once per loaded departments section.
+        @return Dict (cached on the instance - do not mutate)
+        @note Departments with a non-numeric id are skipped; the first entry wins for duplicate ids.
+        """
+        cache = getattr(self, "_dept_budget_cache", None)
+        if cache is None or cache[0] is not self.raw:
+            budgets: Dict[int, Optional[float]] = {}
             for d in (self.raw.departments or []):
-                if int(d.get("id")) == int(department_id):
+                try:
+                    dep_id = int(d.get("id"))
+                except (TypeError, ValueError):
+                    continue
+                if dep_id in budgets:
+                    continue
+                try:
                     val = d.get("budget")
-                    return float(val) if val is not None else None
-        except Exception:
-            return None
-        return None
+                    budgets[dep_id] = float(val) if val is not None else None
+                except (TypeError, ValueError):
+                    budgets[dep_id] = None
+            cache = (self.raw, budgets)
+            self._dept_budget_cache = cache
+        return cache[1]
 
     def _monitoring_metric_list(self) -> List[str]:
         """
@@ -6,6 +6,8 @@
 
 from enum import Enum
 
+import pandas as pd
+
 class Degree(Enum):
     """
     @brief Canonical scientific degree classes for normalization.
@@ -20,6 +22,16 @@ class Degree(Enum):
 DEGREE_ORDER = [d.value for d in (Degree.DSC, Degree.PHD, Degree.MASTER,
                                   Degree.BACHELOR, Degree.NONE, Degree.OTHER)]
 
+# @brief Categorical dtype for the canonical degree column; categories are kept in
+#        lexical order so sorting by degree matches the former object-dtype order
+DEGREE_DTYPE = pd.CategoricalDtype(sorted(DEGREE_ORDER))
+
+# @brief Ordered categorical dtype in canonical DEGREE_ORDER (for distributions)
+DEGREE_ORDER_DTYPE = pd.CategoricalDtype(DEGREE_ORDER, ordered=True)
+
+# @brief Degrees counted as scientific (top performers)
+SCIENCE_DEGREES = frozenset({Degree.DSC.value, Degree.PHD.value})
+
 class ProjectType(Enum):
     """
     @brief Project portfolio classification for ROI comparison.
@@ -38,6 +50,13 @@ class ProjectStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# @brief Lower-case project statuses counted as planning / active in the budget breakdown
+PLANNING_STATUSES = frozenset({"planning", "planned", "plan", "scheduled", "in_planning"})
+ACTIVE_STATUSES = frozenset({"active", "in_progress", "ongoing", "working", "execution", "running"})
+# @brief Lower-case project status that marks a project completed
+COMPLETED_STATUSES = frozenset({ProjectStatus.COMPLETED.value})
+
+
 class RiskLevel(Enum):
     """
     @brief Risk category used in portfolio views.
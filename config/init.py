@@ -13,7 +13,8 @@ from .messages import (
 # Enums, thresholds and normalization maps
 from .enums import (
     Degree, DEGREE_ORDER, DEGREE_MAP_RU,
-    ProjectStatus, ProjectType,
+    DEGREE_DTYPE, DEGREE_ORDER_DTYPE, SCIENCE_DEGREES,
+    ProjectStatus, ProjectType, PLANNING_STATUSES, ACTIVE_STATUSES, COMPLETED_STATUSES,
     RiskLevel, Priority,
     Thresholds,
 )
@@ -24,7 +25,8 @@ __all__ = [
     "LogMsg", "ReportMsg", "ErrMsg",
     # enums & constants,
     "Degree", "DEGREE_ORDER", "DEGREE_MAP_RU",
-    "ProjectStatus", "ProjectType",
+    "DEGREE_DTYPE", "DEGREE_ORDER_DTYPE", "SCIENCE_DEGREES",
+    "ProjectStatus", "ProjectType", "PLANNING_STATUSES", "ACTIVE_STATUSES", "COMPLETED_STATUSES",
     "RiskLevel", "Priority",
     "Thresholds",
 ]
@@ -10,20 +10,18 @@
 
 from __future__ import annotations
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+import importlib
 import os
+from typing import Iterator, List, Optional, Tuple
 
-from analyzers.scientific_analyzer import ScientificAnalyzer
-from analyzers.project_analyzer import ProjectAnalyzer
-from analyzers.innovative_analyzer import InnovativeAnalyzer
-from analyzers.interdepartmental_analyzer import InterdepartmentalAnalyzer
-from analyzers.strategy_analyzer import StrategyAnalyzer
-
+# Analyzers (pandas, matplotlib) and PDFReport (fpdf, PIL) are imported on first use,
+# so --help and runs without --export don't load what they never call.
 from config.messages import HEAD_SCIENCE, HEAD_PROJECTS, HEAD_INNOVATION, HEAD_COLLAB, HEAD_STRATEGY
 
+from utilits.io import ensure_dir, load_json
 from utilits.logger import analysis_logger
 
-from utilits.report_pdf import PDFReport
-
 
 def _print_section(title: str, body: str) -> None:
     """
@@ -36,12 +34,90 @@ def _print_section(title: str, body: str) -> None:
     print(body)
 
 
-def _ensure_dir(path: str) -> None:
+# @brief Report sections in print order:
+#        (heading, "module:AnalyzerClass", plot_all() kwargs or None if no plots)
+ANALYZERS = [
+    (HEAD_SCIENCE, "analyzers.scientific_analyzer:ScientificAnalyzer", {}),
+    (HEAD_PROJECTS, "analyzers.project_analyzer:ProjectAnalyzer", {"bins": 10, "k": 10}),
+    (HEAD_INNOVATION, "analyzers.innovative_analyzer:InnovativeAnalyzer", {"bins": 10}),
+    (HEAD_COLLAB, "analyzers.interdepartmental_analyzer:InterdepartmentalAnalyzer", {"bins": 10}),
+    (HEAD_STRATEGY, "analyzers.strategy_analyzer:StrategyAnalyzer", None),
+]
+
+
+def _analyzer_class(spec: str):
+    """
+    @brief Import an analyzer class lazily.
+    @param spec "module:ClassName"
+    @return Analyzer class
+    """
+    module, name = spec.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def run_section(spec: str, plot_kwargs, json_path: str, department_id: int, out_dir: str,
+                data=None) -> Tuple[str, List[str]]:
+    """
+    @brief Run one report section: analysis, report text and plots.
+    @param spec        Analyzer class as "module:ClassName"
+    @param plot_kwargs Extra plot_all() arguments, or None if the section has no plots
+    @param data        LoadResult to analyze; None - load json_path through the analyzer caches
+    @return (report text, saved plot paths)
+    @note Top-level, so worker processes can import it.
+    """
+    analyzer = _analyzer_class(spec)(json_path, department_id=department_id, data=data)
+    res = analyzer.execute_analysis()
+    text = analyzer.report_text(res)
+    if plot_kwargs is None:
+        return text, []
+    return text, analyzer.plot_all(res, out_dir=out_dir, **plot_kwargs)
+
+
+def _run_sections(data, json_path: str, department_id: int, out_dir: str) -> Iterator[Tuple[str, str, List[str]]]:
+    """
+    @brief Run all report sections; the analyzers are independent, so they run in worker processes.
+    @param data LoadResult from load_company(), used by the in-process fallback
+    @return iterator of (heading, text, plot paths) in report order
+    @note Falls back to in-process execution when only one CPU is available. Workers are not
+          sent the data, so nothing is pickled per worker; they load json_path,
+          which hits the entry load_company() left in BaseAnalyzer._shared when the pool
+          forks, or the disk cache (RND_ANALYZER_CACHE_DIR) otherwise.
+    """
+    workers = min(len(ANALYZERS), os.cpu_count() or 1)
+    if workers <= 1:
+        for title, spec, plot_kwargs in ANALYZERS:
+            yield (title, *run_section(spec, plot_kwargs, json_path, department_id, out_dir, data))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(run_section, spec, plot_kwargs, json_path, department_id, out_dir)
+                   for _, spec, plot_kwargs in ANALYZERS]
+        for (title, _, _), fut in zip(ANALYZERS, futures):
+            yield (title, *fut.result())
+
+
+def _apply_config(parser: argparse.ArgumentParser, config_path: Optional[str]) -> None:
     """
-    @brief Create directory if missing.
+    @brief Use the values of a JSON config file as parser defaults; explicit CLI arguments still win.
+    @param parser     Fully declared argument parser
+    @param config_path Path to the config file, or None
+    @note Keys are argument names ("json_path", "department_id" or "department-id", ...).
     """
-    if path:
-        os.makedirs(path, exist_ok=True)
+    if not config_path:
+        return
+    try:
+        cfg = load_json(config_path)
+    except (OSError, ValueError) as error:
+        parser.error(f"cannot read config {config_path}: {error}")
+    if not isinstance(cfg, dict):
+        parser.error(f"config {config_path} must contain a JSON object")
+    known = set(vars(parser.parse_args([])))
+    defaults = {key.replace("-", "_"): value for key, value in cfg.items()}
+    unknown = sorted(set(defaults) - known)
+    if unknown:
+        parser.error(f"unknown config keys: {', '.join(unknown)}")
+    defaults.pop("config", None)
+    parser.set_defaults(**defaults)
 
 
 def main() -> int:
@@ -50,119 +126,71 @@ def main() -> int:
     @return Exit code (0 - success)
     """
     parser = argparse.ArgumentParser(description="Full R&D Report")
-    parser.add_argument("json_path", help="Path to company.json")
+    parser.add_argument("--config", default=None,
+                        help="JSON file with default arguments, e.g. {\"json_path\": ..., \"export\": true}")
+    parser.add_argument("json_path", nargs="?", default=None, help="Path to company.json")
     parser.add_argument("--department-id", type=int, default=26,
                         help="Target department id (default: 26)")
     parser.add_argument("--out-dir", default=None,
                         help="Output dir for CSV/MD exports (optional)")
     parser.add_argument("--export", action="store_true",
                         help="Export CSV/MD artifacts for grading")
+    _apply_config(parser, parser.parse_known_args()[0].config)
     args = parser.parse_args()
+    if args.json_path is None:
+        parser.error("json_path is required (on the command line or in --config)")
 
     logger = analysis_logger.get_logger("Main")
     logger.info("Starting Task 5 report pipeline")
 
+    from analyzers.base_rnd_analyzer import load_company
+
+    # company.json is loaded once (disk cache / ijson streaming apply); the analyzers reuse its frames
+    data = load_company(args.json_path, args.department_id)
 
-    # 1) Scientific Potential
-    sci = ScientificAnalyzer(args.json_path, department_id=args.department_id)
-    sci_res = sci.execute_analysis()
-    _print_section(HEAD_SCIENCE, sci.print(sci_res))
-    #plots
-    deg_png = sci.plot_degree_distribution(sci_res, out_dir="plots")
-    pie_png  = sci.plot_degree_pie(sci_res, out_dir="plots")
-    cert_pie = sci.plot_certificates_pie(out_dir="plots")
-    print("Saved:", deg_png, pie_png, cert_pie)
-
-    # 2) Project Analysis
-    proj = ProjectAnalyzer(args.json_path, department_id=args.department_id)
-    proj_res = proj.execute_analysis()
-    _print_section(HEAD_PROJECTS, proj.print(proj_res))
-    #plots
-    dur_hist = proj.plot_duration_hist(proj_res, bins=10, out_dir="plots")
-    status_pie = proj.plot_status_pie(proj_res, out_dir="plots")
-    top_long   = proj.plot_top_longest(proj_res, k=10, out_dir="plots")
-    print("Saved:", dur_hist, status_pie, top_long)
-    
-    # 3) Innovation Effectiveness 
-    innov = InnovativeAnalyzer(args.json_path, department_id=args.department_id)
-    innov_res = innov.execute_analysis()
-    _print_section(HEAD_INNOVATION, innov.print(innov_res))
-    #plots
-    inn_bars = innov.plot_cohort_roi_bars(innov_res, out_dir="plots")
-    inn_hist = innov.plot_roi_hist_by_cohort(out_dir="plots", bins=10)
-    inn_pay  = innov.plot_payback_hist_rnd(out_dir="plots", bins=10)
-    inn_scat = innov.plot_roi_vs_duration_scatter(out_dir="plots")
-    print("Saved:", inn_bars, inn_hist, inn_pay, inn_scat)
-
-    # 4) Interdepartmental Collaboration
-    collab = InterdepartmentalAnalyzer(args.json_path, department_id=args.department_id)
-    collab_res = collab.execute_analysis()
-    _print_section(HEAD_COLLAB, collab.print(collab_res))
-    #plots
-    c_pie = collab.plot_collab_rate_pie(out_dir="plots")
-    c_top = collab.plot_top_partners_bar(collab_res, out_dir="plots")
-    c_roi = collab.plot_partners_roi_bar(collab_res, out_dir="plots")
-    c_hist = collab.plot_joint_projects_roi_hist(out_dir="plots", bins=10)
-    print("Saved:", c_pie, c_top, c_roi, c_hist)
-
-    # 5) Development Strategy 
-    strat = StrategyAnalyzer(args.json_path, department_id=args.department_id)
-    strat_res = strat.execute_analysis()
-    _print_section(HEAD_STRATEGY, strat.print(strat_res))
+    texts: List[str] = []
+    plots: List[List[str]] = []
+    for title, text, plot_paths in _run_sections(data, args.json_path, args.department_id, "plots"):
+        texts.append(text)
+        plots.append(plot_paths)
+        _print_section(title, text)
+        if plot_paths:
+            print("Saved:", *plot_paths)
+    sci_text, proj_text, innov_text, collab_text, strat_text = texts
 
     if args.export:
-        os.makedirs("plots", exist_ok=True)
-
-        #Path for image
-        imgs = {
-            "degree_pie":         os.path.join("plots", "degree_distribution_pie.png"),
-            "degree":             os.path.join("plots", "degree_distribution.png"),
-            "cert_pie":           os.path.join("plots", "certificates_pie.png"),
-            "proj_dur":           os.path.join("plots", "projects_duration_hist.png"),
-            "proj_pie":           os.path.join("plots", "projects_status_pie.png"),
-            "proj_toplong":       os.path.join("plots", "projects_top_longest.png"),
-            "innov_scatter":      os.path.join("plots", "innovation_rnd_payback_hist.png"),
-            "innov_main":         os.path.join("plots", "innovation_roi_hist.png"),
-            "innov_rnd_com":      os.path.join("plots", "innovation_cohort_roi_bars.png"),
-            "innov_sct":          os.path.join("plots", "innovation_scatter_roi_duration.png"),
-            "collab_pie":         os.path.join("plots", "collaboration_rate_pie.png"),
-            "collab_top":         os.path.join("plots", "top_partners_bar.png"),
-            "collab_roi":         os.path.join("plots", "partners_by_roi_bar.png"),
-            "collab_roi_hist":    os.path.join("plots", "joint_projects_roi_hist.png"),
-        }
-
-        #Form text sections 
-        sci_text    = sci.print(sci_res)
-        proj_text   = proj.print(proj_res)
-        innov_text  = innov.print(innov_res)
-        collab_text = collab.print(collab_res)
-        strat_text  = strat.print(strat_res)
-
-        out_pdf = os.path.join(args.out_dir or ".", "R&D_Report.pdf")
+        from utilits.report_pdf import PDFReport
+
+        # Image paths as returned by each analyzer's plot_all() (see its @return for the order)
+        degree, degree_pie, cert_pie = plots[0]
+        proj_dur, proj_pie, proj_toplong = plots[1]
+        innov_cohorts, innov_roi, innov_payback, innov_scatter = plots[2]
+        collab_pie, collab_top, collab_roi, collab_roi_hist = plots[3]
+
         pdf = PDFReport(title="Company R&D Report")
         pdf.add_section(HEAD_SCIENCE, sci_text)
         pdf.add_page()
         pdf.set_font("DejaVu", "B", 13)
         pdf.multi_cell(0, 7, "Scientific - charts")
         pdf.ln(4)
-        pdf.image(imgs["degree_pie"], x=15, y=pdf.get_y(), w=85)
-        pdf.image(imgs["degree"], x=110, y=pdf.get_y(), w=85)
+        pdf.image(degree_pie, x=15, y=pdf.get_y(), w=85)
+        pdf.image(degree, x=110, y=pdf.get_y(), w=85)
         pdf.ln(90) 
-        pdf.image(imgs["cert_pie"], x=15, y=pdf.get_y(), w=180)
+        pdf.image(cert_pie, x=15, y=pdf.get_y(), w=180)
 
         pdf.add_section(HEAD_PROJECTS, proj_text)
         pdf.add_image_grid("Projects - charts", [
-            ("", imgs["proj_dur"]),
-            ("", imgs["proj_pie"]),
-            ("", imgs["proj_toplong"]),
+            ("", proj_dur),
+            ("", proj_pie),
+            ("", proj_toplong),
         ])
 
         pdf.add_section(HEAD_INNOVATION, innov_text)
         pdf.add_image_grid("Innovation - charts", [
-            ("", imgs["innov_scatter"]),
-            ("", imgs["innov_main"]),
-            ("", imgs["innov_rnd_com"]),
-            ("", imgs["innov_sct"])
+            ("", innov_payback),
+            ("", innov_roi),
+            ("", innov_cohorts),
+            ("", innov_scatter)
         ])
 
         pdf.add_section(HEAD_COLLAB, collab_text)
@@ -170,20 +198,17 @@ def main() -> int:
         pdf.set_font("DejaVu", "B", 13)
         pdf.multi_cell(0, 7, "Collaboration - charts")
         pdf.ln(4)
-        pdf.image(imgs["collab_pie"], x=15, y=pdf.get_y(), w=85)
-        pdf.image(imgs["collab_top"], x=110, y=pdf.get_y(), w=85)
+        pdf.image(collab_pie, x=15, y=pdf.get_y(), w=85)
+        pdf.image(collab_top, x=110, y=pdf.get_y(), w=85)
         pdf.ln(90) 
-        pdf.image(imgs["collab_roi"], x=15, y=pdf.get_y(), w=85)
-        pdf.image(imgs["collab_roi_hist"], x=110, y=pdf.get_y(), w=85)
+        pdf.image(collab_roi, x=15, y=pdf.get_y(), w=85)
+        pdf.image(collab_roi_hist, x=110, y=pdf.get_y(), w=85)
 
         pdf.add_section(HEAD_STRATEGY, strat_text)
         out_dir = args.out_dir or "out"
         out_pdf = os.path.join(out_dir, "R&D_Report.pdf")
-        os.makedirs(out_dir, exist_ok=True)
-        pdf.output(out_pdf)
-        print(f"PDF saved to: {out_pdf}")
-        pdf.output(out_pdf)
-        print("PDF report saved:", out_pdf)
+        ensure_dir(out_dir)
+        print(f"PDF saved to: {pdf.save(out_pdf)}")
 
     logger.info("Report pipeline finished successfully")
     return 0
@@ -0,0 +1,45 @@
+"""
+@file test_main_workers.py
+@brief main._run_sections with several worker processes gives the same report as the in-process run.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main
+from analyzers.base_rnd_analyzer import load_company
+
+JSON_PATH = os.path.join(ROOT, "company.json")
+DEPARTMENT_ID = 26
+
+
+class RunSectionsWorkersTest(unittest.TestCase):
+    """@brief Sections must not depend on data handed over by the parent process."""
+
+    def _run(self, cpus: int, out_dir: str):
+        data = load_company(JSON_PATH, DEPARTMENT_ID)
+        with mock.patch.object(main.os, "cpu_count", return_value=cpus):
+            return list(main._run_sections(data, JSON_PATH, DEPARTMENT_ID, out_dir))
+
+    def test_workers_match_in_process(self):
+        with tempfile.TemporaryDirectory() as single_dir, tempfile.TemporaryDirectory() as multi_dir:
+            single = self._run(1, single_dir)
+            multi = self._run(4, multi_dir)
+
+            self.assertEqual([title for title, _, _ in multi], [title for title, _, _ in single])
+            self.assertEqual([text for _, text, _ in multi], [text for _, text, _ in single])
+            for (_, _, single_paths), (_, _, multi_paths) in zip(single, multi):
+                self.assertEqual([os.path.basename(p) for p in multi_paths],
+                                 [os.path.basename(p) for p in single_paths])
+                for path in multi_paths:
+                    self.assertTrue(os.path.isfile(path), path)
+
+
+if __name__ == "__main__":
+    unittest.main()
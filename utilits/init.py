@@ -3,6 +3,7 @@
 @brief Utilities (logging, helpers).
 """
 
+from .io import ensure_dir, load_json, parse_json_file
 from .logger import analysis_logger 
 
-__all__ = ["analysis_logger"]
+__all__ = ["analysis_logger", "ensure_dir", "load_json", "parse_json_file"]
@@ -0,0 +1,63 @@
+"""
+@file io.py
+@brief I/O helpers: JSON input (orjson (C, SIMD) when installed, stdlib json otherwise)
+       and output directory creation.
+"""
+
+from pathlib import Path
+from typing import Any, BinaryIO, Set
+import json
+import mmap
+
+try:  # optional fast JSON parser
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json_file(f: BinaryIO) -> Any:
+    """
+    @brief Parse an open binary JSON file (orjson over mmap when available).
+    @param f File object opened in "rb" mode
+    @return Parsed JSON document
+    @note Falls back to f.read() if the file cannot be mapped
+          (empty file, unsupported platform or stream).
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return loads(f.read())
+    try:
+        with memoryview(mm) as mv:
+            return loads(mv if orjson is not None else mv.tobytes())
+    finally:
+        mm.close()
+
+
+def load_json(path: str) -> Any:
+    """
+    @brief Read and parse a JSON file.
+    @param path Path to the file
+    @return Parsed JSON document
+    @throws FileNotFoundError, json.JSONDecodeError (orjson.JSONDecodeError subclasses it)
+    """
+    with open(path, "rb") as f:
+        return parse_json_file(f)
+
+
+# @brief Directories already created by ensure_dir() in this process
+_CREATED_DIRS: Set[str] = set()
+
+
+def ensure_dir(path: str) -> None:
+    """
+    @brief Create a directory (with parents) unless this process already did.
+    @param path Directory path; empty string means the current directory
+    @note Repeated calls for the same path make no syscalls; a directory removed
+          by someone else after the first call is not recreated.
+    """
+    if not path or path in _CREATED_DIRS:
+        return
+    Path(path).mkdir(parents=True, exist_ok=True)
+    _CREATED_DIRS.add(path)
@@ -5,9 +5,48 @@ Provides unified logging functionality with file handlers.
 
 import logging
 import os
+import time
+from pathlib import Path
 from datetime import datetime
 
 
+# @brief Record layout of console and file logs
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    @brief Formatter that calls strftime() at most once per second of log time.
+    Records within the same second reuse the formatted date; only milliseconds are appended.
+    """
+
+    def __init__(self, fmt=None, datefmt=None):
+        """
+        @brief Initialize the formatter.
+        @param fmt Record format string.
+        @param datefmt strftime() format of %(asctime)s (default: logging's "%Y-%m-%d %H:%M:%S,mmm").
+        """
+        super().__init__(fmt, datefmt)
+        self._cached_sec = None
+        self._cached_date = ""
+
+    def formatTime(self, record, datefmt=None):
+        """
+        @brief Format the record time, reusing the date string of the previous record's second.
+        @param record logging.LogRecord being formatted.
+        @param datefmt strftime() format, or None for the default with milliseconds.
+        @return Formatted time string.
+        """
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_date = time.strftime(datefmt or self.default_time_format,
+                                              self.converter(record.created))
+            self._cached_sec = sec
+        if datefmt:
+            return self._cached_date
+        return self.default_msec_format % (self._cached_date, record.msecs)
+
+
 class AnalysisLogger:
     """
     @brief Custom logger class for R&D analysis operations.
@@ -21,6 +60,7 @@ class AnalysisLogger:
         @param log_directory.
         """
         self.log_directory = log_directory
+        self._loggers = {}
         self._ensure_directory()
         self._configure_root_logger()
 
@@ -31,8 +71,7 @@ class AnalysisLogger:
         @throws OSError if the directory cannot be created.
         """
         try:
-            if not os.path.exists(self.log_directory):
-                os.makedirs(self.log_directory)
+            Path(self.log_directory).mkdir(parents=True, exist_ok=True)
         except Exception as error:
             print(f"Cannot create directory: {error}")
 
@@ -41,39 +80,30 @@ class AnalysisLogger:
         @brief Configure the root logger with a standard format and INFO level.
         Called once on initialization to avoid duplicated handlers.
         """
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        console = logging.StreamHandler()
+        console.setFormatter(_CachedTimeFormatter(LOG_FORMAT, datefmt="%Y-%m-%d %H:%M:%S"))
+        logging.basicConfig(level=logging.INFO, handlers=[console])
 
     def get_logger(self, analysis_name):
         """
-        @brief Create and configure a dedicated logger for a specific analysis module.
+        @brief Return the dedicated logger for a specific analysis module.
         @param name Logical name of the analyzer.
         @return Configured logging.Logger instance.
+        @note Memoized per instance: the logger's file handler is created once, not per analyzer object.
         """
-        logger = logging.getLogger(analysis_name)
-        logger.setLevel(logging.INFO)
-
-        # Remove old handlers
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
+        logger = self._loggers.get(analysis_name)
+        if logger is None:
+            logger = logging.getLogger(analysis_name)
+            logger.setLevel(logging.INFO)
 
-        log_filename = f"{analysis_name.lower()}_{datetime.now().strftime('%Y%m%d')}.log"
-        log_path = os.path.join(self.log_directory, log_filename)
-
-        try:
-            file_handler = logging.FileHandler(log_path, encoding="utf-8")
+            log_filename = f"{analysis_name.lower()}_{datetime.now().strftime('%Y%m%d')}.log"
+            log_path = os.path.join(self.log_directory, log_filename)
+            # delay=True: the file is opened by the first record, so unused loggers leave no empty file
+            file_handler = logging.FileHandler(log_path, encoding="utf-8", delay=True)
             file_handler.setLevel(logging.INFO)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(_CachedTimeFormatter(LOG_FORMAT))
             logger.addHandler(file_handler)
-        except Exception as error:
-            print(f"Cannot create file handler for: {error}")
-
+            self._loggers[analysis_name] = logger
         return logger
 
 
@@ -7,7 +7,19 @@ from typing import List, Tuple, Optional
 import os
 from fpdf import FPDF
 
+
 class PDFReport(FPDF):
+    # @brief Write size of save(), bytes
+    WRITE_CHUNK: int = 1 << 20
+
+    # @brief _safe() replacements: typographic dashes and quotes - ASCII (one str.translate pass)
+    _SAFE_TABLE = str.maketrans({
+        "\u2014": "-",   # em dash
+        "\u2013": "-",   # en dash
+        "\u2018": "'", "\u2019": "'",
+        "\u201c": '"', "\u201d": '"',
+    })
+
     def __init__(self, title: str = "R&D Report"):
         super().__init__(orientation="P", unit="mm", format="A4")
         self.set_auto_page_break(auto=True, margin=12)
@@ -32,13 +44,13 @@ class PDFReport(FPDF):
             print(f"[PDFReport] Error loading DejaVu fonts: {e}")
             self._use_dejavu = False
 
-        base_font = "DejaVu" if self._use_dejavu else "Helvetica"
-        self.set_font(base_font, size=12)
+        self._font_name = "DejaVu" if self._use_dejavu else "Helvetica"
+        self.set_font(self._font_name, size=12)
 
         self.title = title
         self.add_page()
 
-        self.set_font(base_font, "B", 16)
+        self.set_font(self._font_name, "B", 16)
         self.cell(0, 10, self._safe(self.title), ln=1, align="C")
         self.ln(2)
 
@@ -48,36 +60,57 @@ class PDFReport(FPDF):
         @param s Input string
         @return str sanitized
         """
-        if s is None:
-            return ""
-        
-        s = (s
-            .replace("\u2014", "-")   # em dash - hyphen
-        )
-        
-        return s
+        return "" if s is None else s.translate(self._SAFE_TABLE)
 
     def footer(self):
         self.set_y(-15)
-        self.set_font("DejaVu" if self._use_dejavu else "Helvetica", "", 9)
+        self.set_font(self._font_name, "", 9)
         self.set_text_color(120, 120, 120)
         self.cell(0, 10, self._safe(f"Page {self.page_no()}"), align="C")
 
     def add_section(self, heading: str, body: str):
         self.add_page()
-        self.set_font("DejaVu" if self._use_dejavu else "Helvetica", "B", 13)
+        self.set_font(self._font_name, "B", 13)
         self.multi_cell(0, 7, self._safe(heading))
         self.ln(2)
-        self.set_font("DejaVu" if self._use_dejavu else "Helvetica", "", 11)
+        self.set_font(self._font_name, "", 11)
         for para in (body or "").split("\n\n"):
             self.multi_cell(0, 6, self._safe(para))
             self.ln(2)
 
+    def save(self, path: str) -> str:
+        """
+        @brief Finish the document and write it to a file atomically.
+        @param path Target file; written to a temporary sibling first and renamed with os.replace()
+        @return path
+        @throws OSError if the file cannot be written (the previous file, if any, is kept)
+        """
+        return self._write_atomic(self.output(dest="S").encode("latin1"), path, self.WRITE_CHUNK)
+
+    @staticmethod
+    def _write_atomic(data: bytes, path: str, chunk: int) -> str:
+        """
+        @brief Write bytes in chunks to a temporary file and atomically move it to path.
+        @return path
+        @throws OSError if the file cannot be written (the temporary file is removed)
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f, memoryview(data) as view:
+                for start in range(0, len(view), chunk):
+                    f.write(view[start:start + chunk])
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        return path
+
     def add_image_page(self, title: str, img_path: str, width_mm: Optional[float] = 180.0):
         if not os.path.exists(img_path):
             return
         self.add_page()
-        self.set_font("DejaVu" if self._use_dejavu else "Helvetica", "B", 12)
+        self.set_font(self._font_name, "B", 12)
         self.multi_cell(0, 7, self._safe(title))
         self.ln(2)
         self.image(img_path, x=None, y=None, w=width_mm)
@@ -86,22 +119,27 @@ class PDFReport(FPDF):
         if not images:
             return
         self.add_page()
-        self.set_font("DejaVu" if self._use_dejavu else "Helvetica", "B", 12)
+        self.set_font(self._font_name, "B", 12)
         self.multi_cell(0, 7, self._safe(title))
         self.ln(2)
 
-        x0, y = self.get_x(), self.get_y()
+        y = self.get_y()
+        xs = [10 + c * cell_w for c in range(cols)]
+        if any(subtitle for subtitle, _ in images):
+            self.set_font(self._font_name, "", 9)
         col = 0
         for subtitle, path in images:
             if not os.path.exists(path):
                 continue
-            x = 10 + col * (cell_w)
+            x = xs[col]
             self.set_xy(x, y)
-            self.image(path, x=x, y=self.get_y(), w=cell_w - 10)
+            self.image(path, x=x, y=y, w=cell_w - 10)
             self.ln(cell_w * 0.55)
-            self.set_x(x)
-            self.set_font("DejaVu" if self._use_dejavu else "Helvetica", "", 9)
-            self.multi_cell(cell_w - 10, 5, self._safe(subtitle), align="C")
+            if subtitle:
+                self.set_x(x)
+                self.multi_cell(cell_w - 10, 5, self._safe(subtitle), align="C")
+            else:
+                self.ln(5)  # same height as an empty subtitle line
             col += 1
             if col >= cols:
                 col = 0